@@ -16,15 +16,19 @@ import sys
 from logging.handlers import TimedRotatingFileHandler
 
 from dotenv import load_dotenv
-from nicegui import Client, ui
+from nicegui import Client, app, ui
 
 from agent_manager.auth_tab import create_auth_tab
 from agent_manager.deploy_tab import create_deploy_tab
 from agent_manager.deregister_tab import create_deregister_tab
 from agent_manager.destroy_tab import create_destroy_tab
-from agent_manager.helpers import get_current_principal
+from agent_manager.helpers import (
+    clear_agentspace_cache,
+    close_de_async_client,
+    get_current_principal,
+)
 from agent_manager.register_tab import create_register_tab
-from agent_manager.test_tab import create_test_tab
+from agent_manager.test_tab import TestTabState, create_test_tab
 from agent_manager.update_tab import create_update_tab
 
 __version__ = "0.6"
@@ -87,20 +91,17 @@ async def main_page(client: Client):
         "destroy_agents": [],
         "destroy_selected": {},
         "register_agent_engines": [],
+        "register_agent_engines_by_name": {},
         "register_agentspaces": [],
+        "register_agentspaces_by_key": {},
         "project_number": None,
         "deregister_agentspaces": [],
+        "deregister_agentspaces_by_key": {},
         "deregister_registered_adk_agents": [],
         "deregister_selection": {},
         "selected_deregister_as_app": None,
         "register_authorizations_list": [],
         "project_id_input_timer": None,
-        "test_username": "test-user",
-        "test_available_agents": [],
-        "test_selected_agent_resource_name": None,
-        "test_remote_agent_instance": None,
-        "test_chat_session_id": None,
-        "test_is_chatting": False,
     }
 
     ui.query("body").classes(add="text-base")
@@ -179,6 +180,16 @@ async def main_page(client: Client):
                     multiple=True,
                     value=default_agentspace_locations,
                 ).props("outlined dense").classes("w-full text-base")
+                ui.button(
+                    "Refresh Agentspace Lookups",
+                    icon="refresh",
+                    on_click=lambda: (
+                        clear_agentspace_cache(),
+                        ui.notify("Cached Agentspace lookups cleared."),
+                    ),
+                ).props("flat dense").classes("self-end").tooltip(
+                    "Drop cached credentials, project numbers and Agentspace app lists so the next fetch queries the APIs again."
+                )
                 bucket_input = (
                     ui.input(
                         "GCS Staging Bucket (Deploy)",
@@ -220,7 +231,7 @@ async def main_page(client: Client):
             AGENT_CONFIGS,
         )
         create_update_tab(page_state, ae_project_input, location_select, bucket_input, AGENT_CONFIGS)
-        create_test_tab(page_state, ae_project_input, location_select)
+        create_test_tab(TestTabState(), ae_project_input, location_select)
         create_destroy_tab(page_state, ae_project_input, location_select)
         create_auth_tab(page_state, as_project_input)
         create_register_tab(
@@ -248,4 +259,8 @@ if __name__ in {"__main__", "__mp_main__"}:
 
     logger.info("Starting ADK Lifecycle Manager WebUI.")
 
+    app.on_shutdown(close_de_async_client)
+
+    # uvicorn's default loop="auto" already runs on uvloop when it is
+    # installed (a non-Windows dependency), so no loop is passed here.
     ui.run(title="Agent Lifecycle Manager", favicon="🛠️", dark=None, port=8080)
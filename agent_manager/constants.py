@@ -20,3 +20,6 @@ SUPPORTED_REGIONS = [
 ]
 
 WEBUI_AGENTDEPLOYMENT_HELPTEXT = "Agent Configurations are derived from the deployment_configs.py file. If you don't see the agent you with to deploy, check that you've updated the file."
+
+# Icon used for registered agents when no Icon URI is provided.
+DEFAULT_AGENT_ICON_URI = "https://fonts.gstatic.com/s/i/short-term/release/googlesymbols/smart_toy/default/24px.svg"
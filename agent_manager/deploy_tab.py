@@ -15,7 +15,7 @@ import asyncio
 import logging
 import time
 import traceback
-from typing import Any, Dict
+from typing import Any, Dict, Mapping
 
 from nicegui import ui
 from vertexai import agent_engines
@@ -23,7 +23,7 @@ from vertexai.preview.reasoning_engines import AdkApp
 
 from agent_manager.constants import WEBUI_AGENTDEPLOYMENT_HELPTEXT
 from agent_manager.helpers import (
-    _BASE_REQUIREMENTS,
+    _BASE_REQ_SET,
     get_agent_root_nicegui,
     init_vertex_ai,
     update_timer,
@@ -224,7 +224,7 @@ async def run_deployment_async(
     location: str,
     bucket: str,
     agent_name: str,
-    agent_config: dict,
+    agent_config: Mapping[str, Any],
     display_name: str,
     description: str,
     service_account: str,
@@ -298,14 +298,13 @@ async def run_deployment_async(
 
     adk_app = AdkApp(agent=root_agent, enable_tracing=True)
     agent_specific_reqs = agent_config.get("requirements", [])
-    if not isinstance(agent_specific_reqs, list):
+    if not isinstance(agent_specific_reqs, (list, tuple)):
         agent_specific_reqs = []
-    combined_requirements = sorted(
-        list(set(_BASE_REQUIREMENTS) | set(agent_specific_reqs))
-    )
+    combined_requirements = sorted(_BASE_REQ_SET.union(agent_specific_reqs))
     extra_packages = agent_config.get("extra_packages", [])
-    if not isinstance(extra_packages, list):
+    if not isinstance(extra_packages, (list, tuple)):
         extra_packages = []
+    extra_packages = list(extra_packages)
 
     with status_area:
         progress_label.set_text(
@@ -363,7 +362,6 @@ async def run_deployment_async(
         logger.error(f"--- Agent creation failed for {agent_name} ---\n{tb_str}")
     finally:
         stop_timer_event.set()
-        await asyncio.sleep(0.1)
         end_time = time.monotonic()
         duration = end_time - start_time
         duration_str = time.strftime("%M:%S", time.gmtime(duration))
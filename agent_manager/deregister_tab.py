@@ -171,13 +171,8 @@ def create_deregister_tab(
 
     async def update_deregister_app_selection():
         selected_as_key = deregister_as_select.value
-        selected_as_app = next(
-            (
-                app
-                for app in page_state.get("deregister_agentspaces", [])
-                if f"{app['location']}/{app['engine_id']}" == selected_as_key
-            ),
-            None,
+        selected_as_app = page_state.get("deregister_agentspaces_by_key", {}).get(
+            selected_as_key
         )
         page_state["selected_deregister_as_app"] = selected_as_app
         logger.debug(f"Deregister selected Agentspace App: {selected_as_app}")
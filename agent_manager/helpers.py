@@ -12,24 +12,46 @@
 
 import asyncio
 import copy
+import datetime
 import importlib
+import io
+import itertools
 import json
 import logging
 import os
 import sys
+import threading
 import time
 import traceback
-from typing import Any, Dict, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+)
 
 import google.auth
 import google.auth.transport.requests
+import httpx
+import ijson
 import requests
 import vertexai
+from dotenv import dotenv_values
 from google.api_core import exceptions as google_exceptions
 from google.cloud import resourcemanager_v3
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 from nicegui import ui
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from agent_manager.constants import DEFAULT_AGENT_ICON_URI
 
 logger = logging.getLogger("WebUIManagerActivity")
 
@@ -39,17 +61,110 @@ _BASE_REQUIREMENTS = [
     "requests",
     "google-cloud-resource-manager",
 ]
+_BASE_REQ_SET = frozenset(_BASE_REQUIREMENTS)
 AS_AUTH_API_BASE_URL = "https://discoveryengine.googleapis.com/v1alpha"
 AS_AUTH_DEFAULT_LOCATION = "global"
 DEFAULT_LOCATIONS_FALLBACK = "global,us"
 AGENTSPACE_DEFAULT_LOCATIONS = os.getenv("AGENTSPACE_LOCATIONS", DEFAULT_LOCATIONS_FALLBACK)
+_DEFAULT_LOCATION_TUPLE = tuple(
+    s for loc in AGENTSPACE_DEFAULT_LOCATIONS.split(",") if (s := loc.strip())
+)
 API_SCOPES = ["https://www.googleapis.com/auth/cloud-platform"]
+AGENTSPACE_ENGINES_CACHE_TTL_SECONDS = 60
+AGENTSPACE_AUTH_CACHE_TTL_SECONDS = 3500
+AGENTSPACE_AUTH_REFRESH_AHEAD_SECONDS = 300
+_TARGET_APP_TYPE = "APP_TYPE_INTRANET"
+# Google APIs only gzip responses for clients whose User-Agent mentions gzip.
+_DE_USER_AGENT = "adk-agent-manager (gzip)"
+# engines.list query: the largest page the API allows, and a partial response
+# carrying only the fields the scan reads.
+_ENGINES_LIST_PARAMS = {
+    "pageSize": 1000,
+    "fields": "engines(name,appType),nextPageToken",
+}
+
+# --- Shared Clients ---
+# gRPC clients are thread-safe and meant to be long-lived; build once and reuse
+# so the channel, credentials and TLS context are not re-created on every call.
+_PROJECTS_CLIENT: Optional[resourcemanager_v3.ProjectsClient] = None
+_CLIENT_LOCK = threading.Lock()
+
+# google.auth.default() walks the whole ADC discovery chain (env vars, gcloud
+# config files, metadata server probe). Resolve it once; the credentials object
+# refreshes its own token when it expires.
+_ADC_CACHE: Optional[Tuple[google.auth.credentials.Credentials, Optional[str]]] = None
+_ADC_LOCK = threading.Lock()
+
+# Cloud Resource Manager v1 discovery client, with the credentials it was built
+# for. Building it parses the discovery document, so it is built once and
+# reused. Its httplib2 transport is not thread-safe, hence the lock around use.
+_CRM_SERVICE: Optional[Tuple[google.auth.credentials.Credentials, Any]] = None
+_CRM_LOCK = threading.Lock()
+
+# Agent Engine updates block for minutes; give them their own small pool so a
+# burst of updates cannot starve the default executor used by asyncio.to_thread.
+_UPDATE_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="ae-update")
+
+# Pooled session for the Discovery Engine REST calls. Every call goes to the
+# same *.discoveryengine.googleapis.com host family, so keep-alive connections
+# avoid a fresh TCP+TLS handshake per request. Only idempotent methods retry.
+_DE_SESSION = requests.Session()
+_DE_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=32,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=[429, 500, 502, 503, 504],
+        ),
+    ),
+)
+
+# Async counterpart of _DE_SESSION for the engine scans. An httpx.AsyncClient
+# is tied to the event loop it was first used on, so one is kept per loop
+# (in practice the single NiceGUI loop). Connection failures are retried; the
+# per-request Authorization header is passed on each call.
+_DE_ASYNC_CLIENT: Optional[httpx.AsyncClient] = None
+_DE_ASYNC_CLIENT_LOOP: Optional[asyncio.AbstractEventLoop] = None
+
+# Agentspace lookup caches. Project numbers never change for a project ID;
+# engine lists are kept for AGENTSPACE_ENGINES_CACHE_TTL_SECONDS.
+_PROJECT_NUMBER_CACHE: dict[str, str] = {}
+_ENGINES_CACHE: dict[tuple[str, tuple[str, ...]], tuple[float, List[Dict[str, Any]]]] = {}
+
+# Refreshed ADC credentials keyed by the requested project ID override, so a
+# whole scan (and repeated scans) share one token instead of refreshing per call.
+_AUTH_CACHE: dict[Optional[str], tuple[float, google.auth.credentials.Credentials, str]] = {}
+# Held while a background token refresh is running, so at most one is in flight.
+_AUTH_REFRESH_LOCK = threading.Lock()
+
+# Parsed .env files keyed by absolute path -> (mtime_ns, size, parsed vars).
+_ENV_CACHE: dict[str, tuple[int, int, dict[str, str]]] = {}
+
+# Environment variables (and prefix) never copied from an agent's .env file.
+RESERVED_ENV_VARS = frozenset({
+    "GOOGLE_CLOUD_PROJECT",
+    "GOOGLE_CLOUD_QUOTA_PROJECT",
+    "GOOGLE_CLOUD_LOCATION",
+    "PORT",
+    "K_SERVICE",
+    "K_REVISION",
+    "K_CONFIGURATION",
+    "GOOGLE_APPLICATION_CREDENTIALS",
+})
+RESERVED_PREFIX = "GOOGLE_CLOUD_AGENT_ENGINE"
 
 # --- Custom Exceptions ---
 class DiscoveryEngineError(Exception):
     """Custom exception for errors during Discovery Engine operations."""
     pass
 
+class VertexAIResourceError(Exception):
+    """Raised by _iter_vertex_ai_resources_pages after the failure was shown in the UI."""
+    pass
+
 # --- Helper Functions ---
 
 def init_vertex_ai(
@@ -84,9 +199,33 @@ def init_vertex_ai(
         logger.error(msg)
         return False, msg
 
+def _projects_client() -> resourcemanager_v3.ProjectsClient:
+    global _PROJECTS_CLIENT
+    client = _PROJECTS_CLIENT
+    if client is None:
+        with _CLIENT_LOCK:
+            client = _PROJECTS_CLIENT = (
+                _PROJECTS_CLIENT or resourcemanager_v3.ProjectsClient()
+            )
+    return client
+
+def _default_credentials() -> Tuple[google.auth.credentials.Credentials, Optional[str]]:
+    global _ADC_CACHE
+    adc = _ADC_CACHE
+    if adc is None:
+        with _ADC_LOCK:
+            adc = _ADC_CACHE = _ADC_CACHE or google.auth.default(scopes=API_SCOPES)
+    return adc
+
+def reset_adc_cache() -> None:
+    """Forgets the resolved ADC so the next lookup runs google.auth.default() again."""
+    global _ADC_CACHE
+    with _ADC_LOCK:
+        _ADC_CACHE = None
+
 def get_project_number_sync(project_id: str) -> Optional[str]:
     try:
-        client = resourcemanager_v3.ProjectsClient()
+        client = _projects_client()
         request = resourcemanager_v3.GetProjectRequest(name=f"projects/{project_id}")
         project = client.get_project(request=request)
         return project.name.split("/")[-1]
@@ -100,7 +239,7 @@ async def get_project_number(project_id: str) -> Optional[str]:
     return await asyncio.to_thread(get_project_number_sync, project_id)
 
 async def get_agent_root_nicegui(
-    agent_config: dict,
+    agent_config: Mapping[str, Any],
 ) -> Tuple[Optional[Any], dict[str, str], Optional[str]]:
     module_path = agent_config.get("module_path", "")
     var_name = agent_config.get("root_variable", "")
@@ -188,17 +327,42 @@ async def update_timer(
         except Exception as e:
             logger.warning(f"Error updating timer UI: {e}")
             break
-        await asyncio.sleep(1)
+        # Wake on the next whole second of elapsed time, or as soon as the
+        # caller sets stop_event, so the loop never outlives the operation.
+        try:
+            await asyncio.wait_for(
+                stop_event.wait(),
+                timeout=1.0 - (time.monotonic() - start_time) % 1.0,
+            )
+        except asyncio.TimeoutError:
+            pass
+
+class AsyncDebouncer:
+    """Coalesces bursts of a UI action (held Enter, double clicks) into one run.
+
+    A trigger within `delay` seconds of the last accepted one is dropped. The
+    accepted action is awaited inline rather than scheduled as a new task, so
+    it keeps the NiceGUI client context of the event handler that fired it.
+    """
+
+    def __init__(self, delay: float = 0.25):
+        self._delay = delay
+        self._last_call_ts = float("-inf")
+
+    async def run(self, coro_factory: Callable[[], Awaitable[Any]]) -> Any:
+        now = time.monotonic()
+        if now - self._last_call_ts < self._delay:
+            return None
+        self._last_call_ts = now
+        return await coro_factory()
 
 def get_access_token_and_credentials_sync_webui() -> (
     tuple[str | None, google.auth.credentials.Credentials | None, str | None]
 ):
     try:
-        credentials, _ = google.auth.default(
-            scopes=["https://www.googleapis.com/auth/cloud-platform"]
-        )
-        auth_req = google.auth.transport.requests.Request()
-        credentials.refresh(auth_req)
+        credentials, _ = _default_credentials()
+        if not credentials.valid:
+            credentials.refresh(google.auth.transport.requests.Request())
         if not credentials.token:
             return None, None, "Failed to refresh token from ADC."
         return credentials.token, credentials, None
@@ -274,7 +438,7 @@ def create_authorization_sync_webui(
             f"CREATE_AUTHORIZATION_REQUEST:\nMethod: POST\nURL: {url}\nHeaders: {json.dumps(log_headers, indent=2)}\nPayload: {json.dumps(logged_payload, indent=2)}"
         )
 
-        response = requests.post(url, headers=headers, json=payload)
+        response = _DE_SESSION.post(url, headers=headers, json=payload)
         response.raise_for_status()
         response_json = response.json()
         logger.info(
@@ -322,7 +486,7 @@ def delete_authorization_sync_webui(
             f"DELETE_AUTHORIZATION_REQUEST:\nMethod: DELETE\nURL: {url}\nHeaders: {json.dumps(log_headers, indent=2)}"
         )
 
-        response = requests.delete(url, headers=headers)
+        response = _DE_SESSION.delete(url, headers=headers)
         response.raise_for_status()
         logger.info(
             f"DELETE_AUTHORIZATION_RESPONSE (Status {response.status_code}):\n{response.text if response.text else '(empty body)'}"
@@ -369,7 +533,7 @@ def list_authorizations_sync_webui(
             f"LIST_AUTHORIZATIONS_REQUEST:\nMethod: GET\nURL: {url}\nHeaders: {json.dumps(log_headers, indent=2)}"
         )
 
-        response = requests.get(url, headers=headers)
+        response = _DE_SESSION.get(url, headers=headers)
         response.raise_for_status()
         response_json = response.json()
         logger.info(
@@ -396,6 +560,46 @@ async def _fetch_vertex_ai_resources(
     resource_lister: callable,
     ui_feedback_context: Dict[str, Any],
 ) -> Tuple[Optional[List[Any]], Optional[str]]:
+    """Lists every resource at once via _iter_vertex_ai_resources_pages.
+
+    Returns (resources, None) on success and (None, error message) once the
+    failure has been shown in the UI.
+    """
+    resources_list: List[Any] = []
+    try:
+        async for page in _iter_vertex_ai_resources_pages(
+            ae_project_id,
+            location,
+            resource_lister,
+            ui_feedback_context,
+            page_size=None,
+        ):
+            resources_list.extend(page)
+    except VertexAIResourceError as e:
+        return None, str(e)
+    return resources_list, None
+
+def _show_vertex_ai_resource_error(msg: str, container: Optional[ui.element]) -> None:
+    ui.notify(msg, type="negative", multi_line=True, close_button=True)
+    if container:
+        with container:
+            container.clear()
+            ui.label(msg).classes("text-red-500")
+
+async def _iter_vertex_ai_resources_pages(
+    ae_project_id: str,
+    location: str,
+    resource_lister: callable,
+    ui_feedback_context: Dict[str, Any],
+    page_size: Optional[int] = 50,
+) -> AsyncIterator[List[Any]]:
+    """Yields Vertex AI resources in pages, with UI feedback while listing.
+
+    Pages hold up to `page_size` resources (all of them when None) as the
+    lister produces them, so callers can render the first page before the
+    rest is fetched. Failures are logged, notified and shown in the optional
+    feedback container, then raised as VertexAIResourceError.
+    """
     button = ui_feedback_context.get("button")
     container = ui_feedback_context.get("container")
     notify_prefix = ui_feedback_context.get("notify_prefix", "Resources")
@@ -408,69 +612,48 @@ async def _fetch_vertex_ai_resources(
         timeout=None,
         close_button=False,
     )
-
-    init_success, init_error_msg = await asyncio.to_thread(
-        init_vertex_ai, ae_project_id, location
-    )
-
-    if not init_success:
-        notification.dismiss()
-        logger.error(
-            f"Vertex AI Initialization Failed for {notify_prefix}: {init_error_msg}"
-        )
-        ui.notify(
-            f"Vertex AI Init Failed: {init_error_msg}",
-            type="negative",
-            multi_line=True,
-            close_button=True,
-        )
-        if container:
-            with container:
-                container.clear()
-                ui.label(f"Vertex AI Init Failed: {init_error_msg}").classes(
-                    "text-red-500"
-                )
-        if button:
-            button.enable()
-        return None, init_error_msg
-
-    notification.message = f"Vertex AI initialized. Fetching {notify_prefix}..."
     try:
+        init_success, init_error_msg = await asyncio.to_thread(
+            init_vertex_ai, ae_project_id, location
+        )
+        if not init_success:
+            msg = f"Vertex AI Init Failed: {init_error_msg}"
+            logger.error(
+                f"Vertex AI Initialization Failed for {notify_prefix}: {init_error_msg}"
+            )
+            _show_vertex_ai_resource_error(msg, container)
+            raise VertexAIResourceError(msg)
+
+        notification.message = f"Vertex AI initialized. Fetching {notify_prefix}..."
+        resources = await asyncio.to_thread(lambda: iter(resource_lister()))
+        total = 0
+        while True:
+            page = await asyncio.to_thread(
+                lambda: list(itertools.islice(resources, page_size))
+            )
+            if not page:
+                break
+            total += len(page)
+            notification.message = f"Fetched {total} {notify_prefix.lower()}..."
+            yield page
 
-        def fetch_and_convert_to_list():
-            return list(resource_lister())
-
-        resources_list = await asyncio.to_thread(fetch_and_convert_to_list)
-
-        notification.spinner = False
-        notification.message = f"Found {len(resources_list)} {notify_prefix.lower()}."
         logger.info(
-            f"Found {len(resources_list)} {notify_prefix.lower()} in {ae_project_id}/{location}."
+            f"Found {total} {notify_prefix.lower()} in {ae_project_id}/{location}."
         )
-        notification.dismiss()
-        return resources_list, None
-
-    except google_exceptions.PermissionDenied:
-        notification.dismiss()
+    except VertexAIResourceError:
+        raise
+    except google_exceptions.PermissionDenied as e:
         msg = f"Permission denied for {notify_prefix}. Ensure 'Vertex AI User' role or necessary permissions in '{ae_project_id}'."
         logger.error(msg)
-        ui.notify(msg, type="negative", multi_line=True, close_button=True)
-        if container:
-            with container:
-                container.clear()
-                ui.label(msg).classes("text-red-500")
-        return None, msg
+        _show_vertex_ai_resource_error(msg, container)
+        raise VertexAIResourceError(msg) from e
     except Exception as e:
-        notification.dismiss()
         msg = f"Failed to list {notify_prefix.lower()}: {e}"
         logger.error(f"{msg}\n{traceback.format_exc()}")
-        ui.notify(msg, type="negative", multi_line=True, close_button=True)
-        if container:
-            with container:
-                container.clear()
-                ui.label(msg).classes("text-red-500")
-        return None, msg
+        _show_vertex_ai_resource_error(msg, container)
+        raise VertexAIResourceError(msg) from e
     finally:
+        notification.dismiss()
         if button:
             button.enable()
 
@@ -501,11 +684,9 @@ def register_agent_sync(
     agentspace_location = agentspace_app["location"]
 
     try:
-        credentials, _ = google.auth.default(
-            scopes=["https://www.googleapis.com/auth/cloud-platform"]
-        )
-        auth_req = google.auth.transport.requests.Request()
-        credentials.refresh(auth_req)
+        credentials, _ = _default_credentials()
+        if not credentials.valid:
+            credentials.refresh(google.auth.transport.requests.Request())
         if not credentials.token:
             logger.error("Failed to refresh token from ADC for registration.")
             raise ValueError("Failed to refresh token from ADC for registration.")
@@ -531,7 +712,7 @@ def register_agent_sync(
             "icon": {
                 "uri": icon_uri
                 if icon_uri
-                else "https://fonts.gstatic.com/s/i/short-term/release/googlesymbols/smart_toy/default/24px.svg"
+                else DEFAULT_AGENT_ICON_URI
             },
             "adk_agent_definition": {
                 "tool_settings": {"tool_description": tool_description},
@@ -554,7 +735,7 @@ def register_agent_sync(
             f"REGISTER_REQUEST:\nMethod: POST\nURL: {api_endpoint}\nHeaders: {json.dumps(log_headers_masked, indent=2)}\nPayload: {json.dumps(payload, indent=2)}"
         )
 
-        response = requests.post(
+        response = _DE_SESSION.post(
             api_endpoint, headers=headers, data=json.dumps(payload)
         )
         response.raise_for_status()
@@ -602,11 +783,9 @@ def get_all_agents_from_assistant_sync(
     api_endpoint = f"https://{hostname}/v1alpha/projects/{as_project_number}/locations/{location}/collections/default_collection/engines/{app_id}/assistants/{assistant_name}/agents"
 
     try:
-        credentials, _ = google.auth.default(
-            scopes=["https://www.googleapis.com/auth/cloud-platform"]
-        )
-        auth_req = google.auth.transport.requests.Request()
-        credentials.refresh(auth_req)
+        credentials, _ = _default_credentials()
+        if not credentials.valid:
+            credentials.refresh(google.auth.transport.requests.Request())
         access_token = credentials.token
         if not credentials.token:
             logger.error("Failed to refresh ADC token for agent list.")
@@ -624,7 +803,7 @@ def get_all_agents_from_assistant_sync(
             f"GET_ALL_AGENTS_REQUEST:\nMethod: GET\nURL: {api_endpoint}\nHeaders: {json.dumps(log_headers_masked, indent=2)}"
         )
 
-        response = requests.get(api_endpoint, headers=headers)
+        response = _DE_SESSION.get(api_endpoint, headers=headers)
         response.raise_for_status()
         agents_list = response.json().get("agents", [])
         logger.info(
@@ -673,11 +852,9 @@ def deregister_agent_sync(
     api_endpoint = f"https://{hostname}/v1alpha/{agent_resource_name}"
 
     try:
-        credentials, _ = google.auth.default(
-            scopes=["https://www.googleapis.com/auth/cloud-platform"]
-        )
-        auth_req = google.auth.transport.requests.Request()
-        credentials.refresh(auth_req)
+        credentials, _ = _default_credentials()
+        if not credentials.valid:
+            credentials.refresh(google.auth.transport.requests.Request())
         access_token = credentials.token
         if not credentials.token:
             logger.error("Failed to refresh ADC token for deregister.")
@@ -695,7 +872,7 @@ def deregister_agent_sync(
             f"DEREGISTER_AGENT_REQUEST:\nMethod: DELETE\nURL: {api_endpoint}\nHeaders: {json.dumps(log_headers_masked, indent=2)}"
         )
 
-        response = requests.delete(api_endpoint, headers=headers)
+        response = _DE_SESSION.delete(api_endpoint, headers=headers)
         response.raise_for_status()
         logger.info(
             f"DEREGISTER_AGENT_RESPONSE (Status {response.status_code}): {response.text if response.text else '(empty body)'}"
@@ -721,11 +898,48 @@ def deregister_agent_sync(
 
 # --- Agentspace Lister Functions ---
 
+def _refresh_credentials_in_background(credentials: google.auth.credentials.Credentials) -> None:
+    try:
+        credentials.refresh(google.auth.transport.requests.Request())
+        logger.info("Refreshed ADC access token ahead of expiry.")
+    except Exception as e:
+        logger.warning(f"Background ADC token refresh failed: {e}")
+    finally:
+        _AUTH_REFRESH_LOCK.release()
+
+def _refresh_ahead(credentials: google.auth.credentials.Credentials) -> None:
+    """Starts a background refresh when a still-valid token is close to expiry.
+
+    The caller keeps using the current token, so the refresh round-trip stays
+    off the request path.
+    """
+    expiry = getattr(credentials, "expiry", None)
+    if expiry is None:
+        return
+    now = datetime.datetime.now(datetime.timezone.utc).replace(tzinfo=None)
+    if (expiry - now).total_seconds() > AGENTSPACE_AUTH_REFRESH_AHEAD_SECONDS:
+        return
+    if not _AUTH_REFRESH_LOCK.acquire(blocking=False):
+        return
+    threading.Thread(
+        target=_refresh_credentials_in_background,
+        args=(credentials,),
+        name="adc-refresh",
+        daemon=True,
+    ).start()
+
 def _get_auth_details(project_id_override: Optional[str] = None) -> Tuple[google.auth.credentials.Credentials, Optional[str], str]:
+    cached = _AUTH_CACHE.get(project_id_override)
+    if cached:
+        cached_at, credentials, effective_project_id = cached
+        if time.monotonic() - cached_at < AGENTSPACE_AUTH_CACHE_TTL_SECONDS and credentials.valid:
+            _refresh_ahead(credentials)
+            return credentials, credentials.token, effective_project_id
+        _AUTH_CACHE.pop(project_id_override, None)
     try:
-        credentials, project_id_from_adc = google.auth.default(scopes=API_SCOPES)
-        auth_req = google.auth.transport.requests.Request()
-        credentials.refresh(auth_req)
+        credentials, project_id_from_adc = _default_credentials()
+        if not credentials.valid:
+            credentials.refresh(google.auth.transport.requests.Request())
 
         effective_project_id = project_id_override or project_id_from_adc
         if not effective_project_id:
@@ -734,6 +948,7 @@ def _get_auth_details(project_id_override: Optional[str] = None) -> Tuple[google
         logger.info(f"Using Project ID for lookup: {effective_project_id}")
         if not credentials.token:
             raise DiscoveryEngineError("Failed to obtain access token after refreshing credentials.")
+        _AUTH_CACHE[project_id_override] = (time.monotonic(), credentials, effective_project_id)
         return credentials, credentials.token, effective_project_id
     except google.auth.exceptions.DefaultCredentialsError as e:
         logger.error(f"Authentication error: {e}. Ensure ADC setup ('gcloud auth application-default login').")
@@ -742,13 +957,39 @@ def _get_auth_details(project_id_override: Optional[str] = None) -> Tuple[google
         logger.error(f"An unexpected error occurred during authentication: {e}")
         raise DiscoveryEngineError(f"An unexpected error occurred during authentication: {e}") from e
 
+def clear_agentspace_cache() -> None:
+    """Drops cached credentials, project numbers and engine lists so the next fetch hits the APIs."""
+    reset_adc_cache()
+    _AUTH_CACHE.clear()
+    _PROJECT_NUMBER_CACHE.clear()
+    _ENGINES_CACHE.clear()
+
+def _crm_service(credentials: google.auth.credentials.Credentials) -> Any:
+    """Returns the shared Resource Manager client; call with _CRM_LOCK held."""
+    global _CRM_SERVICE
+    if _CRM_SERVICE is None or _CRM_SERVICE[0] is not credentials:
+        # static_discovery reads the discovery document bundled with
+        # google-api-python-client instead of fetching it over HTTP.
+        _CRM_SERVICE = (
+            credentials,
+            build(
+                'cloudresourcemanager', 'v1', credentials=credentials,
+                static_discovery=True, cache_discovery=False,
+            ),
+        )
+    return _CRM_SERVICE[1]
+
 def _get_project_number_for_agentspace(project_id: str, credentials: google.auth.credentials.Credentials) -> str:
+    cached_number = _PROJECT_NUMBER_CACHE.get(project_id)
+    if cached_number:
+        return cached_number
     try:
-        service = build('cloudresourcemanager', 'v1', credentials=credentials)
-        project = service.projects().get(projectId=project_id).execute()
+        with _CRM_LOCK:
+            project = _crm_service(credentials).projects().get(projectId=project_id).execute()
         project_number = project.get('projectNumber')
         if project_number:
             logger.info(f"Successfully looked up Project Number for '{project_id}': {project_number}")
+            _PROJECT_NUMBER_CACHE[project_id] = project_number
             return project_number
         else:
             logger.error(f"Could not find project number for project ID '{project_id}'. Response: {project}")
@@ -762,7 +1003,104 @@ def _get_project_number_for_agentspace(project_id: str, credentials: google.auth
         logger.error(f"An unexpected error occurred during project number lookup: {e}")
         raise DiscoveryEngineError(f"An unexpected error occurred during project number lookup: {e}") from e
 
-def _fetch_matching_engines(project_number: str, locations: List[str] | str, access_token: str) -> List[Dict[str, Any]]:
+def _de_async_client() -> httpx.AsyncClient:
+    global _DE_ASYNC_CLIENT, _DE_ASYNC_CLIENT_LOOP
+    loop = asyncio.get_running_loop()
+    if _DE_ASYNC_CLIENT is None or _DE_ASYNC_CLIENT_LOOP is not loop:
+        if _DE_ASYNC_CLIENT is not None:
+            # The previous client can only be closed on its own loop; once
+            # that loop is closed its connections have already gone with it.
+            old_loop = _DE_ASYNC_CLIENT_LOOP
+            if old_loop.is_running() and not old_loop.is_closed():
+                asyncio.run_coroutine_threadsafe(_DE_ASYNC_CLIENT.aclose(), old_loop)
+        limits = httpx.Limits(max_connections=32, max_keepalive_connections=16)
+        _DE_ASYNC_CLIENT = httpx.AsyncClient(
+            http2=True,
+            timeout=httpx.Timeout(30, connect=5),
+            limits=limits,
+            transport=httpx.AsyncHTTPTransport(http2=True, limits=limits, retries=2),
+        )
+        _DE_ASYNC_CLIENT_LOOP = loop
+    return _DE_ASYNC_CLIENT
+
+async def close_de_async_client() -> None:
+    """Closes the shared Discovery Engine async client; run on app shutdown."""
+    global _DE_ASYNC_CLIENT, _DE_ASYNC_CLIENT_LOOP
+    client, _DE_ASYNC_CLIENT, _DE_ASYNC_CLIENT_LOOP = _DE_ASYNC_CLIENT, None, None
+    if client is not None:
+        await client.aclose()
+
+class _AsyncResponseReader:
+    """Minimal async file-like view of a streamed httpx response for ijson."""
+
+    def __init__(self, response: httpx.Response):
+        self._chunks = response.aiter_bytes()
+
+    async def read(self, size: int = -1) -> bytes:
+        if size == 0:
+            return b""
+        return await anext(self._chunks, b"")
+
+async def _iter_engines_page(
+    response: httpx.Response, page_state: Dict[str, Optional[str]]
+) -> AsyncIterator[Dict[str, Any]]:
+    """Yields each engine of one engines.list page as it is decoded.
+
+    The page's nextPageToken, which may come before or after the engines, is
+    stored in page_state["nextPageToken"].
+    """
+    builder = None
+    async for prefix, event, value in ijson.parse(_AsyncResponseReader(response)):
+        if prefix == "engines.item" and event == "start_map":
+            builder = ijson.ObjectBuilder()
+        if builder is not None:
+            builder.event(event, value)
+            if prefix == "engines.item" and event == "end_map":
+                yield builder.value
+                builder = None
+        elif prefix == "nextPageToken" and event == "string":
+            page_state["nextPageToken"] = value
+
+async def _stream_location_engines(
+    client: httpx.AsyncClient, location: str, api_endpoint: str, headers: Dict[str, str]
+) -> Tuple[int, List[Dict[str, Any]]]:
+    """Streams one location's engines.list and keeps only matching engines.
+
+    Engines are decoded one at a time from the response body, so non-matching
+    engines are discarded as soon as they are read instead of being held in a
+    fully parsed response. Every page is followed until there is no
+    nextPageToken.
+    """
+    engines_seen = 0
+    matches = []
+    params = dict(_ENGINES_LIST_PARAMS)
+    while True:
+        page_state: Dict[str, Optional[str]] = {"nextPageToken": None}
+        async with client.stream(
+            "GET", api_endpoint, headers=headers, params=params
+        ) as response:
+            if response.is_error:
+                await response.aread()
+            response.raise_for_status()
+            async for engine in _iter_engines_page(response, page_state):
+                engines_seen += 1
+                if engine.get("appType") == _TARGET_APP_TYPE:
+                    engine_id = engine.get("name", "").rpartition("/")[2] or "N/A"
+                    # "key"/"label" are the select option value and text used by
+                    # the UI, built here once alongside the decode.
+                    matches.append({
+                        "engine_id": engine_id,
+                        "location": location,
+                        "appType": _TARGET_APP_TYPE,
+                        "key": f"{location}/{engine_id}",
+                        "label": f"{engine_id} ({location})",
+                    })
+        if not page_state["nextPageToken"]:
+            break
+        params["pageToken"] = page_state["nextPageToken"]
+    return engines_seen, matches
+
+async def _fetch_matching_engines(project_number: str, locations: List[str] | Tuple[str, ...] | str, access_token: str) -> List[Dict[str, Any]]:
     matching_engines_details = []
 
     if not access_token:
@@ -772,24 +1110,36 @@ def _fetch_matching_engines(project_number: str, locations: List[str] | str, acc
         logger.error("Missing project number for fetching engines.")
         return []
 
+    if isinstance(locations, (list, tuple)):
+        location_list = [s for loc in locations if (s := str(loc).strip())]
+    elif isinstance(locations, str):
+        location_list = [s for loc in locations.split(",") if (s := loc.strip())]
+    else:
+        logger.warning("Invalid 'locations' type provided. Expected list or comma-separated string.")
+        return []
+    if not location_list:
+        logger.warning("No locations provided for fetching engines.")
+        return []
+
+    cache_key = (project_number, tuple(sorted(location_list)))
+    cached = _ENGINES_CACHE.get(cache_key)
+    if cached and time.monotonic() - cached[0] < AGENTSPACE_ENGINES_CACHE_TTL_SECONDS:
+        logger.info(f"Using cached engine list for project number {project_number} in {location_list}.")
+        return list(cached[1])
+
     headers = {
         "Authorization": f"Bearer {access_token}",
         "Content-Type": "application/json",
-        "X-Goog-User-Project": project_number
+        "X-Goog-User-Project": project_number,
+        "Accept-Encoding": "gzip",
+        "User-Agent": _DE_USER_AGENT,
     }
     log_headers_masked = {
         k: ("Bearer [token redacted]" if k == "Authorization" else v)
         for k, v in headers.items()
     }
 
-    if isinstance(locations, list):
-        location_list = [str(loc).strip() for loc in locations if str(loc).strip()]
-    elif isinstance(locations, str):
-        location_list = [loc.strip() for loc in locations.split(",") if loc.strip()]
-    else:
-        logger.warning("Invalid 'locations' type provided. Expected list or comma-separated string.")
-        return []
-
+    endpoints = []
     for location in location_list:
         logger.info(f"Checking location via REST: {location} (Project Number: {project_number})")
         api_host = (
@@ -797,69 +1147,83 @@ def _fetch_matching_engines(project_number: str, locations: List[str] | str, acc
             if location != "global" else "discoveryengine.googleapis.com"
         )
         api_endpoint = f"https://{api_host}/v1beta/projects/{project_number}/locations/{location}/collections/default_collection/engines"
+        logger.info(
+            f"FETCH_ENGINES_REQUEST:\nMethod: GET\nURL: {api_endpoint}\nHeaders: {json.dumps(log_headers_masked, indent=2)}"
+        )
+        endpoints.append((location, api_endpoint))
+
+    # All locations are independent, so issue the GETs concurrently and pay
+    # max(RTT) instead of sum(RTT) across the scan. The pooled client keeps its
+    # connections alive between scans.
+    client = _de_async_client()
+    results = await asyncio.gather(
+        *[
+            _stream_location_engines(client, location, api_endpoint, headers)
+            for location, api_endpoint in endpoints
+        ],
+        return_exceptions=True,
+    )
 
+    scan_failed = False
+    for (location, api_endpoint), result in zip(endpoints, results):
         try:
-            logger.info(
-                f"FETCH_ENGINES_REQUEST:\nMethod: GET\nURL: {api_endpoint}\nHeaders: {json.dumps(log_headers_masked, indent=2)}"
-            )
-            response = requests.get(api_endpoint, headers=headers, timeout=30)
-            response.raise_for_status()
+            if isinstance(result, BaseException):
+                raise result
+            engines_seen, matches = result
 
-            data = response.json()
-            engines_in_response = data.get("engines", [])
-
-            if not engines_in_response:
+            if not engines_seen:
                 logger.info(f"No engines found in {location} under default_collection.")
                 continue
 
-            logger.info(f"Found {len(engines_in_response)} engine(s) in {location}. Checking for 'APP_TYPE_INTRANET' appType...")
-            engines_matched_in_location = 0
-            for engine in engines_in_response:
-                app_type = engine.get("appType")
-
-                if app_type == "APP_TYPE_INTRANET":
-                        engines_matched_in_location += 1
-                        engine_id = engine.get("name", "N/A").split('/')[-1]
-                        matching_engines_details.append({
-                            "engine_id": engine_id,
-                            "location": location,
-                            "appType": app_type
-                        })
-                        logger.info(f"  Match found - Engine ID: {engine_id}, Location: {location}, AppType: {app_type}")
-                else:
-                    logger.info(f"  Skipping engine {engine.get('name', 'N/A').split('/')[-1]} in {location} - AppType is '{app_type}' (not 'APP_TYPE_INTRANET').")
-
-            if engines_matched_in_location == 0:
+            logger.info(f"Found {engines_seen} engine(s) in {location}, {len(matches)} with appType '{_TARGET_APP_TYPE}'.")
+            matching_engines_details.extend(matches)
+
+            if logger.isEnabledFor(logging.DEBUG):
+                for match in matches:
+                    logger.debug(f"  Match found - Engine ID: {match['engine_id']}, Location: {location}, AppType: {match['appType']}")
+
+            if not matches:
                 logger.info(f"No engines in {location} matched the appType criteria.")
 
-        except requests.exceptions.Timeout:
+        except httpx.TimeoutException:
+             scan_failed = True
              logger.warning(f"Timeout calling API for location {location}: {api_endpoint}")
-        except requests.exceptions.RequestException as e:
+        except httpx.HTTPError as e:
+             scan_failed = True
              logger.error(f"Error calling API for location {location}: {e}")
-             if isinstance(e, requests.exceptions.HTTPError):
+             if isinstance(e, httpx.HTTPStatusError):
                  try:
                      logger.error(f"Response Body: {e.response.text}")
                  except Exception:
                      logger.error("Could not read error response body.")
-        except json.JSONDecodeError:
+        except ijson.JSONError:
+            scan_failed = True
             logger.error(f"Error decoding JSON response for location {location}.")
         except Exception as e:
+             scan_failed = True
              logger.error(f"An unexpected error occurred processing location {location}: {e}")
 
+    # Only cache complete scans so a transient failure is retried next time.
+    if not scan_failed:
+        _ENGINES_CACHE[cache_key] = (time.monotonic(), list(matching_engines_details))
     return matching_engines_details
 
 
-def get_agentspace_apps_from_projectid(project_id: str, locations: List[str] | str = AGENTSPACE_DEFAULT_LOCATIONS) -> List[Dict[str, Any]]:
+async def get_agentspace_apps_from_projectid(project_id: str, locations: List[str] | Tuple[str, ...] | str = _DEFAULT_LOCATION_TUPLE) -> List[Dict[str, Any]]:
     try:
-        credentials, access_token, _ = _get_auth_details(project_id_override=project_id)
+        credentials, access_token, _ = await asyncio.to_thread(
+            _get_auth_details, project_id_override=project_id
+        )
         if not access_token:
             raise DiscoveryEngineError("Failed to obtain access token during authentication.")
 
-        project_number = _get_project_number_for_agentspace(project_id, credentials)
+        project_number = await asyncio.to_thread(
+            _get_project_number_for_agentspace, project_id, credentials
+        )
 
-        matching_engines = _fetch_matching_engines(project_number, locations, access_token)
+        matching_engines = await _fetch_matching_engines(project_number, locations, access_token)
 
-        logger.info(f"Found {len(matching_engines)} engine(s) with appType 'APP_TYPE_INTRANET'.")
+        logger.info(f"Found {len(matching_engines)} engine(s) with appType '{_TARGET_APP_TYPE}'.")
         return matching_engines
 
     except DiscoveryEngineError as e:
@@ -888,6 +1252,7 @@ async def fetch_agentspace_apps(
     select_ui.set_visibility(False)
     select_ui.clear()
     page_state[state_key] = []
+    page_state[f"{state_key}_by_key"] = {}
 
     notification = ui.notification(
         f"Fetching Agentspace apps from '{project_id}'...",
@@ -897,8 +1262,8 @@ async def fetch_agentspace_apps(
     )
 
     try:
-        agentspaces = await asyncio.to_thread(
-            get_agentspace_apps_from_projectid, project_id, locations
+        agentspaces = await get_agentspace_apps_from_projectid(
+            project_id, locations
         )
 
         if not agentspaces:
@@ -909,10 +1274,10 @@ async def fetch_agentspace_apps(
             await asyncio.sleep(3)
         else:
             page_state[state_key] = agentspaces
-            options = {
-                f"{app['location']}/{app['engine_id']}": f"{app['engine_id']} ({app['location']})"
-                for app in agentspaces
+            page_state[f"{state_key}_by_key"] = {
+                app["key"]: app for app in agentspaces
             }
+            options = {app["key"]: app["label"] for app in agentspaces}
             select_ui.options = options
             select_ui.set_visibility(True)
             logger.info(
@@ -954,68 +1319,42 @@ def load_env_variables(relative_path: str) -> dict[str, str]:
         excluding reserved keys. Returns an empty dictionary if the file does
         not exist, cannot be read, is empty, or contains no valid entries.
     """
-    # Define the list of environment variables to skip
-    RESERVED_ENV_VARS = {
-        "GOOGLE_CLOUD_PROJECT",
-        "GOOGLE_CLOUD_QUOTA_PROJECT",
-        "GOOGLE_CLOUD_LOCATION",
-        "PORT",
-        "K_SERVICE",
-        "K_REVISION",
-        "K_CONFIGURATION",
-        "GOOGLE_APPLICATION_CREDENTIALS",
-    }
-    # Define the prefix for environment variables to skip
-    RESERVED_PREFIX = "GOOGLE_CLOUD_AGENT_ENGINE"
-
     # Determine the absolute path to this script (deployment_helpers.py)
     # to correctly resolve the relative_path for the .env file.
     base_dir = os.path.dirname(os.path.abspath(__file__))
-    dotenv_path = os.path.join(base_dir, relative_path)
+    dotenv_path = os.path.abspath(os.path.join(base_dir, relative_path))
 
     env_vars: dict[str, str] = {}
 
-    if not os.path.exists(dotenv_path):
+    try:
+        stat_result = os.stat(dotenv_path)
+    except OSError:
         # print(f"Info: .env file not found at {dotenv_path}", file=sys.stderr)
         return env_vars
 
+    # Skip re-reading and re-parsing when the file is unchanged since last load.
+    cached = _ENV_CACHE.get(dotenv_path)
+    if cached and cached[:2] == (stat_result.st_mtime_ns, stat_result.st_size):
+        return dict(cached[2])
+
     try:
         with open(dotenv_path, 'r', encoding='utf-8') as f:
-            for line_content in f:
-                line = line_content.strip()
-
-                if not line or line.startswith('#'): # Skip empty lines and comments
-                    continue
-
-                if '=' not in line: # Skip lines without an '=' separator
-                    continue
-
-                key, value = line.split('=', 1)
-                key = key.strip()
-                # Handle 'export' prefix (e.g., "export KEY=VALUE")
-                if key.startswith("export "):
-                    key = key.split(" ", 1)[1].strip()
-
-                # Skip reserved environment variables
-                if key in RESERVED_ENV_VARS or key.startswith(RESERVED_PREFIX):
-                    # print(f"Skipping reserved environment variable: {key}", file=sys.stderr) # Optional: for debugging
-                    continue
-
-                # Strip inline comments from the value part first
-                if '#' in value:
-                    value = value.split('#', 1)[0]
-
-                value = value.strip() # Strip whitespace from the (potentially comment-stripped) value
-
-                # Remove surrounding quotes (single or double) from the value
-                if len(value) > 1 and ((value.startswith("\"") and value.endswith("\"")) or \
-                                       (value.startswith("'") and value.endswith("'"))):
-                    value = value[1:-1]
-
-                if key: # Ensure key is not empty
-                    env_vars[key] = value
+            text = f.read()
     except IOError as e:
         print(f"Warning: Could not read .env file at {dotenv_path}. Error: {e}", file=sys.stderr)
         return {} # Return empty if file read fails
 
+    # python-dotenv handles quoting, escapes, `export` and inline comments.
+    # Interpolation stays off so values are taken literally, as before.
+    for key, value in dotenv_values(stream=io.StringIO(text), interpolate=False).items():
+        # Skip reserved environment variables and bare keys without a value
+        if value is None or key in RESERVED_ENV_VARS or key.startswith(RESERVED_PREFIX):
+            continue
+        env_vars[key] = value
+
+    _ENV_CACHE[dotenv_path] = (
+        stat_result.st_mtime_ns,
+        stat_result.st_size,
+        dict(env_vars),
+    )
     return env_vars
@@ -13,21 +13,32 @@
 
 import asyncio
 import logging
-from typing import Any, Dict
+from typing import Any, Dict, List, Mapping, Tuple
 
 from nicegui import ui
 from vertexai import agent_engines
 
+from agent_manager.constants import DEFAULT_AGENT_ICON_URI
 from agent_manager.helpers import (
     _fetch_vertex_ai_resources,
     fetch_agentspace_apps,
-    get_project_number,
+    get_project_number_sync,
     register_agent_sync,
 )
 
 logger = logging.getLogger("WebUIManagerActivity")
 
 
+def _resolve_and_register(
+    as_project: str, *register_args: Any
+) -> Tuple[bool, str]:
+    """Looks up the Agentspace project number and registers in one worker hop."""
+    as_project_num = get_project_number_sync(as_project)
+    if not as_project_num:
+        return False, f"Could not resolve project number for '{as_project}'."
+    return register_agent_sync(as_project, as_project_num, *register_args)
+
+
 def create_register_tab(
     page_state: Dict[str, Any],
     ae_project_input: ui.input,
@@ -36,6 +47,13 @@ def create_register_tab(
     agentspace_locations_select: ui.select,
     agent_configs: Dict[str, Any],
 ) -> None:
+    # Deployment config per Agent Engine display name, used to prefill the
+    # registration form. The first config wins when display names repeat.
+    configs_by_display_name: Dict[str, Mapping[str, Any]] = {}
+    for cfg in agent_configs.values():
+        if isinstance(cfg, Mapping) and "ae_display_name" in cfg:
+            configs_by_display_name.setdefault(cfg["ae_display_name"], cfg)
+
     with ui.tab_panel("register"):
         with ui.column().classes("w-full p-4 gap-4"):
             ui.label("Register Agent Engine with Agentspace").classes(
@@ -120,7 +138,7 @@ def create_register_tab(
                     ).props("outlined dense").classes("w-full")
                     register_icon_input = ui.input(
                         "Icon URI (optional)",
-                        value="https://fonts.gstatic.com/s/i/short-term/release/googlesymbols/smart_toy/default/24px.svg",
+                        value=DEFAULT_AGENT_ICON_URI,
                     ).props("outlined dense").classes("w-full")
 
                     ui.label("Authorizations (Optional)").classes(
@@ -133,10 +151,35 @@ def create_register_tab(
                         "w-full gap-1"
                     )
 
+                    def _add_register_auth_row(
+                        auths: List[str], index: int
+                    ) -> None:
+                        def _set_auth(e, index=index):
+                            auths[index] = e.value
+
+                        with ui.row().classes("w-full items-center no-wrap"):
+                            ui.input(
+                                label=f"Auth #{index+1}",
+                                value=auths[index],
+                                placeholder="projects/PROJECT_ID/locations/global/authorizations/AUTH_ID",
+                                on_change=_set_auth,
+                            ).props("outlined dense clearable").classes(
+                                "flex-grow"
+                            )
+                            ui.button(
+                                icon="remove_circle_outline",
+                                on_click=lambda _, index=index: (
+                                    auths.pop(index),
+                                    render_register_auth_inputs.refresh(),
+                                ),
+                            ).props("flat color=negative dense").tooltip(
+                                "Remove this authorization"
+                            )
+
                     @ui.refreshable
                     def render_register_auth_inputs():
                         direct_auth_inputs_container.clear()
-                        current_auths = page_state.get(
+                        current_auths = page_state.setdefault(
                             "register_authorizations_list", []
                         )
                         with direct_auth_inputs_container:
@@ -144,70 +187,37 @@ def create_register_tab(
                                 ui.label(
                                     "No authorizations added yet."
                                 ).classes("text-xs text-gray-400")
-                            for i, auth_value in enumerate(current_auths):
-                                with ui.row().classes(
-                                    "w-full items-center no-wrap"
-                                ):
-                                    ui.input(
-                                        label=f"Auth #{i+1}",
-                                        value=auth_value,
-                                        placeholder="projects/PROJECT_ID/locations/global/authorizations/AUTH_ID",
-                                        on_change=lambda e, index=i: page_state[
-                                            "register_authorizations_list"
-                                        ].__setitem__(index, e.value),
-                                    ).props(
-                                        "outlined dense clearable"
-                                    ).classes(
-                                        "flex-grow"
-                                    )
-                                    ui.button(
-                                        icon="remove_circle_outline",
-                                        on_click=lambda _, index=i: (
-                                            page_state[
-                                                "register_authorizations_list"
-                                            ].pop(index),
-                                            render_register_auth_inputs.refresh(),
-                                        ),
-                                    ).props(
-                                        "flat color=negative dense"
-                                    ).tooltip(
-                                        "Remove this authorization"
-                                    )
+                            for i in range(len(current_auths)):
+                                _add_register_auth_row(current_auths, i)
+
+                    def add_register_auth_input():
+                        # Appending only needs one new row; a full rebuild is
+                        # reserved for removals, where row indices shift.
+                        auths = page_state.setdefault(
+                            "register_authorizations_list", []
+                        )
+                        auths.append("")
+                        if len(auths) == 1:
+                            render_register_auth_inputs.refresh()
+                            return
+                        with direct_auth_inputs_container:
+                            _add_register_auth_row(auths, len(auths) - 1)
 
                     render_register_auth_inputs()
                     ui.button(
                         "Add Authorization",
                         icon="add",
-                        on_click=lambda: (
-                            page_state.setdefault(
-                                "register_authorizations_list", []
-                            ).append(""),
-                            render_register_auth_inputs.refresh(),
-                        ),
+                        on_click=add_register_auth_input,
                     ).classes("mt-2 self-start")
 
                     async def update_register_defaults():
                         selected_ae_resource = register_ae_select.value
-                        selected_ae = next(
-                            (
-                                ae
-                                for ae in page_state.get(
-                                    "register_agent_engines", []
-                                )
-                                if ae.resource_name == selected_ae_resource
-                            ),
-                            None,
-                        )
+                        selected_ae = page_state.get(
+                            "register_agent_engines_by_name", {}
+                        ).get(selected_ae_resource)
                         if selected_ae:
-                            config_match = next(
-                                (
-                                    cfg
-                                    for cfg_key, cfg in agent_configs.items()
-                                    if isinstance(cfg, dict)
-                                    and cfg.get("ae_display_name")
-                                    == selected_ae.display_name
-                                ),
-                                None,
+                            config_match = configs_by_display_name.get(
+                                selected_ae.display_name
                             )
                             if config_match:
                                 register_display_name_input.value = (
@@ -228,7 +238,7 @@ def create_register_tab(
                                 )
                                 register_icon_input.value = config_match.get(
                                     "as_uri",
-                                    "https://fonts.gstatic.com/s/i/short-term/release/googlesymbols/smart_toy/default/24px.svg",
+                                    DEFAULT_AGENT_ICON_URI,
                                 )
                             else:
                                 register_display_name_input.value = (
@@ -241,7 +251,7 @@ def create_register_tab(
                                 register_tool_description_input.value = (
                                     default_desc
                                 )
-                                register_icon_input.value = "https://fonts.gstatic.com/s/i/short-term/release/googlesymbols/smart_toy/default/24px.svg"
+                                register_icon_input.value = DEFAULT_AGENT_ICON_URI
                         page_state["register_authorizations_list"] = []
                         render_register_auth_inputs.refresh()
 
@@ -277,12 +287,13 @@ def create_register_tab(
         page_state: dict,
         next_button: ui.button,
     ) -> None:
+        # _fetch_vertex_ai_resources disables/re-enables fetch_button itself;
+        # only reset the select here and apply its final state once below.
         next_button.disable()
-        fetch_button.disable()
-        select_element.clear()
         select_element.set_value(None)
-        page_state["register_agent_engines"] = []
         select_element.set_visibility(False)
+        page_state["register_agent_engines"] = []
+        page_state["register_agent_engines_by_name"] = {}
 
         existing_agents, error_msg = await _fetch_vertex_ai_resources(
             ae_project_id,
@@ -294,57 +305,59 @@ def create_register_tab(
             },
         )
 
-        if error_msg:
-            fetch_button.enable()
+        if error_msg or existing_agents is None:
             return
 
-        if existing_agents is not None:
-            page_state["register_agent_engines"] = existing_agents
-
-            if not existing_agents:
-                ui.notify("No deployed Agent Engines found.", type="info")
-                logger.info(
-                    f"No deployed Agent Engines found in {ae_project_id}/{location} for registration."
-                )
-                select_element.set_options([])
-            else:
-
-                def _create_register_options(agents_list):
-                    options = {}
-                    for agent in agents_list:
-                        create_time_str = (
-                            agent.create_time.strftime("%Y-%m-%d %H:%M")
-                            if agent.create_time
-                            else "N/A"
-                        )
-                        update_time_str = (
-                            agent.update_time.strftime("%Y-%m-%d %H:%M")
-                            if agent.update_time
-                            else "N/A"
-                        )
-                        display_text = (
-                            f"{agent.display_name} ({agent.resource_name.split('/')[-1]}) | "
-                            f"Created: {create_time_str} | Updated: {update_time_str}"
-                        )
-                        options[agent.resource_name] = display_text
-                    return options
-
-                options = await asyncio.to_thread(
-                    _create_register_options, existing_agents
-                )
+        page_state["register_agent_engines"] = existing_agents
+        page_state["register_agent_engines_by_name"] = {
+            ae.resource_name: ae for ae in existing_agents
+        }
+        options = {}
+        if not existing_agents:
+            ui.notify("No deployed Agent Engines found.", type="info")
+            logger.info(
+                f"No deployed Agent Engines found in {ae_project_id}/{location} for registration."
+            )
+        else:
+
+            def _create_register_options(agents_list):
+                options = {}
+                for agent in agents_list:
+                    # isoformat is C-level and avoids strftime's locale
+                    # handling; slicing drops any UTC offset suffix so the
+                    # text stays "YYYY-MM-DD HH:MM".
+                    create_time_str = (
+                        agent.create_time.isoformat(
+                            sep=" ", timespec="minutes"
+                        )[:16]
+                        if agent.create_time
+                        else "N/A"
+                    )
+                    update_time_str = (
+                        agent.update_time.isoformat(
+                            sep=" ", timespec="minutes"
+                        )[:16]
+                        if agent.update_time
+                        else "N/A"
+                    )
+                    display_text = (
+                        f"{agent.display_name} ({agent.resource_name.split('/')[-1]}) | "
+                        f"Created: {create_time_str} | Updated: {update_time_str}"
+                    )
+                    options[agent.resource_name] = display_text
+                return options
 
-                select_element.set_options(options)
-                logger.info(
-                    f"Found {len(existing_agents)} Agent Engines in {ae_project_id}/{location} for registration."
-                )
+            # Pure formatting: run inline. Only blocking I/O goes to a thread.
+            options = _create_register_options(existing_agents)
+            logger.info(
+                f"Found {len(existing_agents)} Agent Engines in {ae_project_id}/{location} for registration."
+            )
 
-            select_element.set_visibility(True)
-            fetch_button.enable()
-        fetch_button.enable()
+        select_element.set_options(options)
+        select_element.set_visibility(bool(options))
 
     async def start_registration():
         as_project = as_project_input.value
-        as_project_num = await get_project_number(as_project)
         selected_ae_resource = register_ae_select.value
         selected_as_key = register_as_select.value
 
@@ -365,7 +378,6 @@ def create_register_tab(
         if not all(
             [
                 as_project,
-                as_project_num,
                 selected_ae_resource,
                 selected_as_key,
                 display_name,
@@ -382,13 +394,8 @@ def create_register_tab(
             f"Starting registration. AS Project: {as_project}, AE Resource: {selected_ae_resource}, AS App Key: {selected_as_key}, Display Name: {display_name}, Authorizations: {authorizations_list_for_api}"
         )
 
-        selected_as_app = next(
-            (
-                app
-                for app in page_state.get("register_agentspaces", [])
-                if f"{app['location']}/{app['engine_id']}" == selected_as_key
-            ),
-            None,
+        selected_as_app = page_state.get("register_agentspaces_by_key", {}).get(
+            selected_as_key
         )
         if not selected_as_app:
             ui.notify(
@@ -404,9 +411,8 @@ def create_register_tab(
             ui.spinner()
 
         success, message = await asyncio.to_thread(
-            register_agent_sync,
+            _resolve_and_register,
             as_project,
-            as_project_num,
             selected_as_app,
             selected_ae_resource,
             display_name,
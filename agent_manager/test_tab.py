@@ -12,23 +12,122 @@
 #  limitations under the License.
 
 import asyncio
+import functools
 import logging
-import traceback
-from typing import Any, Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 from nicegui import ui
 from vertexai import agent_engines
 
-from agent_manager.helpers import _fetch_vertex_ai_resources, init_vertex_ai
+from agent_manager.helpers import (
+    AsyncDebouncer,
+    VertexAIResourceError,
+    _iter_vertex_ai_resources_pages,
+    init_vertex_ai,
+)
 
 logger = logging.getLogger("WebUIManagerActivity")
 
+_STREAM_END = object()
+_TEST_AGENT_CACHE_SIZE = 8
+_STREAM_FLUSH_INTERVAL = 0.05
+
+# Test chat GCP calls (init, get, create_session and one hop per streamed
+# event) run on their own pool so busy chats do not queue behind, or starve,
+# the default executor used by the other tabs.
+_GCP_EXECUTOR = ThreadPoolExecutor(max_workers=64, thread_name_prefix="gcp")
+_STREAM_SEM = asyncio.Semaphore(32)
+# At most one outstanding stream per (client, username, agent). The NiceGUI
+# client id keeps browser sessions sharing the default username apart. Keys
+# are added before the first await of a send and removed when it ends.
+_ACTIVE_USER_AGENT_STREAMS: Set[Tuple[str, str, str]] = set()
+
+
+async def _run_blocking(func, *args, **kwargs):
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _GCP_EXECUTOR, functools.partial(func, *args, **kwargs)
+    )
+
+
+@dataclass(slots=True)
+class TestTabState:
+    """Per-page state of the test tab, read on every chat event."""
+
+    test_username: str = "test-user"
+    test_available_agents: List[Any] = field(default_factory=list)
+    test_short_ids: Dict[str, str] = field(default_factory=dict)
+    test_selected_agent_resource_name: Optional[str] = None
+    test_remote_agent_instance: Any = None
+    test_chat_session_id: Optional[str] = None
+    test_agent_cache: Dict[Tuple[str, ...], Tuple[Any, str]] = field(
+        default_factory=dict
+    )
+    test_agent_init_locks: Dict[Tuple[str, ...], asyncio.Lock] = field(
+        default_factory=dict
+    )
+    test_is_chatting: bool = False
+    test_tasks: Set[asyncio.Task] = field(default_factory=set)
+
+    def track_task(self, task: asyncio.Task) -> asyncio.Task:
+        """Ties a task to the page so it is cancelled when the page goes away."""
+        self.test_tasks.add(task)
+        task.add_done_callback(self.test_tasks.discard)
+        return task
+
+    def cancel_tasks(self) -> None:
+        for task in list(self.test_tasks):
+            task.cancel()
+
+
+def _short_agent_id(state: TestTabState, resource_name: str) -> str:
+    """Returns the trailing ID of an agent resource name, cached per fetch."""
+    return state.test_short_ids.get(
+        resource_name
+    ) or resource_name.rpartition("/")[2]
+
+
+def _extract_response_parts(event: Dict[str, Any]) -> List[Dict[str, str]]:
+    """Returns the displayable thought/text parts of a model stream_query event."""
+    content = event.get("content")
+    if isinstance(content, dict) and content.get("role") == "model":
+        source = content
+    elif event.get("role") == "model":
+        source = event
+    else:
+        return []
+
+    response_parts = []
+    for part in source.get("parts", ()):
+        text = part.get("text")
+        if part.get("thought"):
+            response_parts.append(
+                {"type": "thought", "content": f"🤔: *{text or ''}*"}
+            )
+        elif text:
+            response_parts.append({"type": "text", "content": text})
+    return response_parts
+
 
 def create_test_tab(
-    page_state: Dict[str, Any],
+    state: TestTabState,
     ae_project_input: ui.input,
     location_select: ui.select,
 ) -> None:
+    def on_test_agent_change(e):
+        handle_test_agent_selection(e.value)
+
+    send_debouncer = AsyncDebouncer()
+    fetch_debouncer = AsyncDebouncer()
+
+    # Stop warm-ups and in-flight streams once the page is gone, so no worker
+    # keeps pulling events for a closed tab. on_delete fires after the
+    # reconnect window; older NiceGUI releases only offer on_disconnect.
+    client = ui.context.client
+    getattr(client, "on_delete", client.on_disconnect)(state.cancel_tasks)
+
     with ui.tab_panel("test"):
         with ui.column().classes("w-full p-4 gap-4 items-stretch"):
             with ui.row().classes("items-center gap-2"):
@@ -63,9 +162,7 @@ def create_test_tab(
                             options={},
                             label="Choose Agent Engine",
                             with_input=True,
-                            on_change=lambda e: handle_test_agent_selection(
-                                e.value
-                            ),
+                            on_change=on_test_agent_change,
                         )
                         .props("outlined dense")
                         .classes("flex-grow")
@@ -78,10 +175,8 @@ def create_test_tab(
                 ).classes("text-lg font-semibold")
                 ui.input(
                     "Username",
-                    value=page_state["test_username"],
-                    on_change=lambda e: page_state.update(
-                        {"test_username": e.value}
-                    ),
+                    value=state.test_username,
+                    on_change=lambda e: setattr(state, "test_username", e.value),
                 ).props("outlined dense").classes("w-full")
 
             with ui.card().classes(
@@ -111,11 +206,7 @@ def create_test_tab(
                             ),
                         )
                     )
-                    test_send_message_button = ui.button(
-                        "Send",
-                        icon="send",
-                        on_click=lambda: handle_test_send_message(),
-                    )
+                    test_send_message_button = ui.button("Send", icon="send")
                     test_send_message_button.disable()
 
     async def fetch_agent_engines_for_test_chat():
@@ -130,99 +221,189 @@ def create_test_tab(
 
         test_agent_select.clear()
         test_agent_select.set_value(None)
-        page_state["test_available_agents"] = []
+        state.test_available_agents = []
+        state.test_short_ids = {}
         test_agent_select.set_visibility(False)
-        await handle_test_agent_selection(None)
-
-        existing_agents, error_msg = await _fetch_vertex_ai_resources(
-            ae_project,
-            ae_location,
-            agent_engines.list,
-            ui_feedback_context={
-                "button": test_fetch_agents_button,
-                "notify_prefix": "Agent Engines (Test)",
-            },
-        )
+        handle_test_agent_selection(None)
 
-        if error_msg:
+        # Options are filled page by page so the select is usable as soon as
+        # the first page of agents has been fetched.
+        options: Dict[str, str] = {}
+        try:
+            async for page in _iter_vertex_ai_resources_pages(
+                ae_project,
+                ae_location,
+                agent_engines.list,
+                ui_feedback_context={
+                    "button": test_fetch_agents_button,
+                    "notify_prefix": "Agent Engines (Test)",
+                },
+            ):
+                state.test_available_agents.extend(page)
+                for agent in page:
+                    short_id = agent.resource_name.rpartition("/")[2]
+                    state.test_short_ids[agent.resource_name] = short_id
+                    options[agent.resource_name] = (
+                        f"{agent.display_name} ({short_id})"
+                    )
+                test_agent_select.set_options(options)
+                test_agent_select.set_visibility(True)
+        except VertexAIResourceError:
             return
 
-        if existing_agents is not None:
-            page_state["test_available_agents"] = existing_agents
-            if not existing_agents:
-                ui.notify(
-                    "No deployed Agent Engines found for testing.", type="info"
+        if not options:
+            ui.notify("No deployed Agent Engines found for testing.", type="info")
+        else:
+            ui.notify(
+                f"Found {len(options)} Agent Engines for testing.",
+                type="positive",
+            )
+        test_agent_select.set_visibility(True)
+
+    test_fetch_agents_button.on_click(
+        functools.partial(fetch_debouncer.run, fetch_agent_engines_for_test_chat)
+    )
+
+    async def connect_test_agent(
+        ae_project: str, ae_location: str, resource_name: str, username: str
+    ) -> Tuple[Any, str]:
+        """Returns the remote agent and a session ID, connecting on a cache miss.
+
+        Connected agents and their sessions are kept per project, location,
+        agent and user, so switching back to an agent reuses its session
+        instead of repeating init/get/create_session. Concurrent callers for
+        the same key (e.g. a warm-up and a send) share one connection attempt.
+        """
+        cache_key = (ae_project, ae_location, resource_name, username)
+        agent_cache = state.test_agent_cache
+        init_locks = state.test_agent_init_locks
+        async with init_locks.setdefault(cache_key, asyncio.Lock()):
+            connection = agent_cache.pop(cache_key, None)
+            if not connection:
+                logger.info(f"Initializing connection to test agent: {resource_name}")
+
+                # The resource name is fully qualified, so the agent lookup
+                # does not depend on vertexai.init and both round-trips can
+                # overlap.
+                init_result, remote_agent = await asyncio.gather(
+                    _run_blocking(init_vertex_ai, ae_project, ae_location),
+                    _run_blocking(agent_engines.get, resource_name=resource_name),
+                    return_exceptions=True,
                 )
-                test_agent_select.set_options([])
-            else:
-
-                def _create_test_options(agents_list):
-                    return {
-                        agent.resource_name: f"{agent.display_name} ({agent.resource_name.split('/')[-1]})"
-                        for agent in agents_list
-                    }
+                if isinstance(init_result, BaseException):
+                    raise init_result
+                init_ok, init_msg = init_result
+                if not init_ok:
+                    raise Exception(f"Vertex AI Init Failed for test: {init_msg}")
+                if isinstance(remote_agent, BaseException):
+                    raise remote_agent
 
-                options = await asyncio.to_thread(
-                    _create_test_options, existing_agents
+                session_object = await _run_blocking(
+                    remote_agent.create_session, user_id=username
                 )
-                test_agent_select.set_options(options)
-                ui.notify(
-                    f"Found {len(existing_agents)} Agent Engines for testing.",
-                    type="positive",
+                if not (isinstance(session_object, dict) and "id" in session_object):
+                    logger.error(
+                        f"Failed to extract test session ID from session object: {session_object}"
+                    )
+                    raise Exception(
+                        f"Could not obtain valid test session ID. Response: {str(session_object)[:200]}"
+                    )
+                connection = (remote_agent, session_object["id"])
+                logger.info(
+                    f"Created new test session ID: {connection[1]} for agent {resource_name}"
                 )
-            test_agent_select.set_visibility(True)
 
-    test_fetch_agents_button.on_click(fetch_agent_engines_for_test_chat)
+            agent_cache[cache_key] = connection
+            while len(agent_cache) > _TEST_AGENT_CACHE_SIZE:
+                evicted_key = next(iter(agent_cache))
+                del agent_cache[evicted_key]
+                init_locks.pop(evicted_key, None)
+            return connection
 
-    async def handle_test_agent_selection(resource_name: Optional[str]):
+    async def warm_connect_test_agent(
+        ae_project: str, ae_location: str, resource_name: str, username: str
+    ) -> None:
+        try:
+            await connect_test_agent(ae_project, ae_location, resource_name, username)
+        except Exception as e:
+            # The next send retries the connection and reports the error.
+            logger.warning(f"Warm-up connection to test agent {resource_name} failed: {e}")
+
+    def handle_test_agent_selection(resource_name: Optional[str]):
         logger.info(f"Test Agent selected via UI: {resource_name}")
-        page_state["test_selected_agent_resource_name"] = resource_name
-        page_state["test_remote_agent_instance"] = None
-        page_state["test_chat_session_id"] = None
+        state.test_selected_agent_resource_name = resource_name
+        state.test_remote_agent_instance = None
+        state.test_chat_session_id = None
         with test_chat_messages_area:
             test_chat_messages_area.clear()
         if resource_name:
             selected_agent_display_name = test_agent_select.options.get(
-                resource_name,
-                resource_name.split("/")[-1] if resource_name else "Agent",
-            )
+                resource_name
+            ) or _short_agent_id(state, resource_name)
             ui.notify(
                 f"Test Agent '{selected_agent_display_name}' selected. Ready to chat.",
                 type="info",
             )
             test_send_message_button.set_enabled(
-                not page_state["test_is_chatting"]
+                not state.test_is_chatting
             )
+            # Connect while the user is still typing so the first send does
+            # not pay for init/get/create_session.
+            if ae_project_input.value and location_select.value:
+                state.track_task(
+                    asyncio.create_task(
+                        warm_connect_test_agent(
+                            ae_project_input.value,
+                            location_select.value,
+                            resource_name,
+                            state.test_username,
+                        )
+                    )
+                )
         else:
             test_send_message_button.set_enabled(False)
 
     async def handle_test_send_message():
+        # Checked before any await so a second send cannot slip in while the
+        # first is still starting up.
+        if state.test_is_chatting:
+            return
         user_message_text = test_message_input.value
         if not user_message_text or not user_message_text.strip():
             ui.notify("Message cannot be empty for test chat.", type="warning")
             return
 
-        if not page_state["test_selected_agent_resource_name"]:
+        if not state.test_selected_agent_resource_name:
             ui.notify(
                 "Please select an Agent Engine for testing first.", type="warning"
             )
             return
 
-        page_state["test_is_chatting"] = True
+        stream_key = (
+            client.id,
+            state.test_username,
+            state.test_selected_agent_resource_name,
+        )
+        if stream_key in _ACTIVE_USER_AGENT_STREAMS:
+            ui.notify(
+                "Previous message to this agent is still streaming.",
+                type="warning",
+            )
+            return
+
+        state.test_is_chatting = True
         test_send_message_button.set_enabled(False)
+        state.track_task(asyncio.current_task())
 
         with test_chat_messages_area:
             ui.chat_message(
-                user_message_text, name=page_state["test_username"], sent=True
+                user_message_text, name=state.test_username, sent=True
             )
         test_message_input.set_value(None)
 
-        agent_display_name = "Agent"
-        if page_state["test_selected_agent_resource_name"]:
-            agent_display_name = test_agent_select.options.get(
-                page_state["test_selected_agent_resource_name"],
-                page_state["test_selected_agent_resource_name"].split("/")[-1],
-            )
+        agent_display_name = test_agent_select.options.get(
+            state.test_selected_agent_resource_name
+        ) or _short_agent_id(state, state.test_selected_agent_resource_name)
 
         thinking_message_container = None
         with test_chat_messages_area:
@@ -230,148 +411,94 @@ def create_test_tab(
                 name=agent_display_name, stamp="typing..."
             )
 
+        # No await since the membership check above, so claiming the key here
+        # still keeps a second send for this user and agent out.
+        _ACTIVE_USER_AGENT_STREAMS.add(stream_key)
         try:
-            current_ae_project = ae_project_input.value
-            current_ae_location = location_select.value
-
-            if (
-                not page_state["test_remote_agent_instance"]
-                or not page_state["test_chat_session_id"]
-            ):
-                logger.info(
-                    f"Initializing connection to test agent: {page_state['test_selected_agent_resource_name']}"
-                )
-
-                init_ok, init_msg = await asyncio.to_thread(
-                    init_vertex_ai, current_ae_project, current_ae_location
-                )
-                if not init_ok:
-                    ui.notify(
-                        f"Failed to initialize Vertex AI for test: {init_msg}",
-                        type="negative",
-                    )
-                    if thinking_message_container:
-                        thinking_message_container.delete()
-                    raise Exception(f"Vertex AI Init Failed for test: {init_msg}")
-
-                def get_agent_sync_test():
-                    return agent_engines.get(
-                        resource_name=page_state[
-                            "test_selected_agent_resource_name"
-                        ]
-                    )
-
-                remote_agent = await asyncio.to_thread(get_agent_sync_test)
-                page_state["test_remote_agent_instance"] = remote_agent
+            (
+                state.test_remote_agent_instance,
+                state.test_chat_session_id,
+            ) = await connect_test_agent(
+                ae_project_input.value,
+                location_select.value,
+                state.test_selected_agent_resource_name,
+                state.test_username,
+            )
 
-                def create_session_sync_test():
-                    if page_state["test_remote_agent_instance"]:
-                        return page_state[
-                            "test_remote_agent_instance"
-                        ].create_session(user_id=page_state["test_username"])
-                    raise Exception(
-                        "Test remote agent instance became unavailable before session creation."
-                    )
+            logger.info(
+                f"Sending message to test agent: '{user_message_text}', session: {state.test_chat_session_id}"
+            )
 
-                session_object = await asyncio.to_thread(create_session_sync_test)
-                if isinstance(session_object, dict) and "id" in session_object:
-                    page_state["test_chat_session_id"] = session_object["id"]
-                    logger.info(
-                        f"Created new test session ID: {page_state['test_chat_session_id']} for agent {page_state['test_selected_agent_resource_name']}"
-                    )
-                else:
-                    logger.error(
-                        f"Failed to extract test session ID from session object: {session_object}"
-                    )
-                    ui.notify(
-                        f"Error: Could not obtain a valid test session ID. Response: {str(session_object)[:200]}",
-                        type="negative",
-                        multi_line=True,
-                    )
-                    if thinking_message_container:
-                        thinking_message_container.delete()
-                    raise Exception(
-                        f"Could not obtain valid test session ID. Response: {session_object}"
+            agent_instance = state.test_remote_agent_instance
+            if not agent_instance:
+                raise Exception("Test remote agent instance not available.")
+
+            # Bound concurrent streams so one busy page cannot take every
+            # worker thread away from the other tabs and users.
+            async with _STREAM_SEM:
+                # Pull events one at a time so each part is shown as soon as it
+                # arrives and no worker thread is held for the whole response.
+                events = await _run_blocking(
+                    lambda: iter(
+                        agent_instance.stream_query(
+                            message=user_message_text,
+                            session_id=state.test_chat_session_id,
+                            user_id=state.test_username,
+                        )
                     )
-                ui.notify(
-                    "Connected to test agent and session started.", type="positive"
                 )
+                # Parts are shown in one agent message whose content is
+                # re-rendered at most every _STREAM_FLUSH_INTERVAL seconds, so
+                # long responses do not cost a websocket update per event.
+                loop = asyncio.get_running_loop()
+                all_events_received, response_buffer = [], []
+                response_markdown, last_flush = None, 0.0
+                while True:
+                    event = await _run_blocking(next, events, _STREAM_END)
+                    if event is _STREAM_END:
+                        break
+                    all_events_received.append(event)
+                    parts = _extract_response_parts(event)
+                    if not parts:
+                        continue
+                    response_buffer.extend(part["content"] for part in parts)
+                    if response_markdown is None:
+                        if thinking_message_container:
+                            thinking_message_container.delete()
+                            thinking_message_container = None
+                        with test_chat_messages_area:
+                            with ui.chat_message(
+                                name=agent_display_name, sent=False
+                            ):
+                                response_markdown = ui.markdown()
+                    if loop.time() - last_flush >= _STREAM_FLUSH_INTERVAL:
+                        response_markdown.set_content("\n\n".join(response_buffer))
+                        last_flush = loop.time()
+                        await asyncio.sleep(0)
+
+                if response_markdown is not None:
+                    response_markdown.set_content("\n\n".join(response_buffer))
+                response_parts_count = len(response_buffer)
 
             logger.info(
-                f"Sending message to test agent: '{user_message_text}', session: {page_state['test_chat_session_id']}"
-            )
-
-            def stream_and_parse_agent_response_sync_test() -> List[Dict[str, str]]:
-                agent_instance = page_state["test_remote_agent_instance"]
-                if not agent_instance:
-                    raise Exception("Test remote agent instance not available.")
-
-                response_parts, all_events_received = [], []
-                for event in agent_instance.stream_query(
-                    message=user_message_text,
-                    session_id=page_state["test_chat_session_id"],
-                    user_id=page_state["test_username"],
-                ):
-                    all_events_received.append(event)
-                    event_content = event.get("content")
-                    if (
-                        isinstance(event_content, dict)
-                        and event_content.get("role") == "model"
-                    ):
-                        for part in event_content.get("parts", []):
-                            if part.get("thought"):
-                                response_parts.append(
-                                    {
-                                        "type": "thought",
-                                        "content": f"🤔: *{part.get('text', '')}*",
-                                    }
-                                )
-                            elif "text" in part and part["text"]:
-                                response_parts.append(
-                                    {"type": "text", "content": part["text"]}
-                                )
-                    elif event.get("role") == "model":
-                        for part in event.get("parts", []):
-                            if part.get("thought"):
-                                response_parts.append(
-                                    {
-                                        "type": "thought",
-                                        "content": f"🤔: *{part.get('text', '')}*",
-                                    }
-                                )
-                            elif "text" in part and part["text"]:
-                                response_parts.append(
-                                    {"type": "text", "content": part["text"]}
-                                )
-
-                if not response_parts:
-                    logger.warning(
-                        f"Test agent stream_query no text parts. Events: {all_events_received}"
-                    )
-                    return [
-                        {
-                            "type": "text",
-                            "content": "Agent did not return a textual response.",
-                        }
-                    ]
-                return response_parts
-
-            agent_response_parts = await asyncio.to_thread(
-                stream_and_parse_agent_response_sync_test
+                f"Test agent response complete: {response_parts_count} part(s) from {len(all_events_received)} event(s)."
             )
-            logger.info(f"Aggregated test agent response parts: {agent_response_parts}")
-            if thinking_message_container:
-                thinking_message_container.delete()
-            with test_chat_messages_area:
-                for part in agent_response_parts:
+            if not response_parts_count:
+                logger.warning(
+                    f"Test agent stream_query no text parts. Events: {all_events_received}"
+                )
+                if thinking_message_container:
+                    thinking_message_container.delete()
+                    thinking_message_container = None
+                with test_chat_messages_area:
                     ui.chat_message(
-                        str(part["content"]),
+                        "Agent did not return a textual response.",
                         name=agent_display_name,
                         sent=False,
                     )
 
         except Exception as e:
-            logger.error(f"Error during test chat: {e}\n{traceback.format_exc()}")
+            logger.exception("Error during test chat: %s", e)
             ui.notify(
                 f"Test Chat Error: {e}",
                 type="negative",
@@ -382,7 +509,7 @@ def create_test_tab(
                 try:
                     thinking_message_container.delete()
                 except Exception as del_e:
-                    logger.warning(f"Could not delete test thinking message: {del_e}")
+                    logger.warning("Could not delete test thinking message: %s", del_e)
             with test_chat_messages_area:
                 ui.chat_message(
                     f"Error: {str(e)[:100]}...",
@@ -391,7 +518,12 @@ def create_test_tab(
                     stamp="Error",
                 )
         finally:
-            page_state["test_is_chatting"] = False
+            _ACTIVE_USER_AGENT_STREAMS.discard(stream_key)
+            state.test_is_chatting = False
             test_send_message_button.set_enabled(
-                bool(page_state["test_selected_agent_resource_name"])
+                bool(state.test_selected_agent_resource_name)
             )
+
+    test_send_message_button.on_click(
+        functools.partial(send_debouncer.run, handle_test_send_message)
+    )
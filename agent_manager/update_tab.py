@@ -13,14 +13,15 @@ import asyncio
 import logging
 import time
 import traceback
-from typing import Any, Dict
+from typing import Any, Dict, Mapping
 
 from nicegui import ui
 from vertexai import agent_engines
 from vertexai.preview.reasoning_engines import AdkApp
 
 from agent_manager.helpers import (
-    _BASE_REQUIREMENTS,
+    _BASE_REQ_SET,
+    _UPDATE_POOL,
     _fetch_vertex_ai_resources,
     get_agent_root_nicegui,
     init_vertex_ai,
@@ -29,6 +30,10 @@ from agent_manager.helpers import (
 
 logger = logging.getLogger("WebUIManagerActivity")
 
+_TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M"
+# display name, short ID, created, updated
+_OPTION_LABEL_FORMAT = "{} ({}) | Created: {} | Updated: {}"
+
 
 def create_update_tab(
     page_state: Dict[str, Any],
@@ -138,6 +143,9 @@ def create_update_tab(
                             update_description_input.value,
                             update_service_account_input.value,
                             update_status_area,
+                            update_result_label,
+                            update_result_markdown,
+                            update_result_html,
                         ),
                     )
                     update_status_area = ui.column().classes(
@@ -147,6 +155,17 @@ def create_update_tab(
                         ui.label("Ready for update.").classes(
                             "text-sm text-gray-500"
                         )
+                    # Result elements sit outside update_status_area, which is
+                    # cleared on every run, so each update only refills them.
+                    update_result_label = ui.label().classes("font-semibold mt-2")
+                    update_result_markdown = ui.markdown().classes("text-sm")
+                    update_result_html = ui.html()
+                    for element in (
+                        update_result_label,
+                        update_result_markdown,
+                        update_result_html,
+                    ):
+                        element.set_visibility(False)
 
                     with ui.stepper_navigation():
                         ui.button(
@@ -157,24 +176,38 @@ def create_update_tab(
                         update_button
 
     def _create_update_options(agents_list):
-        options = {}
-        for agent in agents_list:
-            create_time_str = (
-                agent.create_time.strftime("%Y-%m-%d %H:%M")
+        """Returns the select options and per-agent details shown on selection.
+
+        The details are read straight off the resource proto once here (off the
+        event loop) rather than on every selection change.
+        """
+        options = {
+            agent.resource_name: _OPTION_LABEL_FORMAT.format(
+                agent.display_name,
+                agent.resource_name.rsplit("/", 1)[-1],
+                agent.create_time.strftime(_TIMESTAMP_FORMAT)
                 if agent.create_time
-                else "N/A"
-            )
-            update_time_str = (
-                agent.update_time.strftime("%Y-%m-%d %H:%M")
+                else "N/A",
+                agent.update_time.strftime(_TIMESTAMP_FORMAT)
                 if agent.update_time
-                else "N/A"
-            )
-            display_text = (
-                f"{agent.display_name} ({agent.resource_name.split('/')[-1]}) | "
-                f"Created: {create_time_str} | Updated: {update_time_str}"
+                else "N/A",
             )
-            options[agent.resource_name] = display_text
-        return options
+            for agent in agents_list
+        }
+        agent_meta = {}
+        for agent in agents_list:
+            # Only two fields are needed, so read them off the proto instead of
+            # serializing the whole resource with to_dict(). Unset proto string
+            # fields read as "".
+            resource = getattr(agent, "_gca_resource", None)
+            agent_meta[agent.resource_name] = {
+                "description": getattr(resource, "description", "") or "",
+                "service_account": getattr(
+                    getattr(resource, "spec", None), "service_account", ""
+                )
+                or "N/A (Default AE Service Acct)",
+            }
+        return options, agent_meta
 
     async def fetch_agent_engines_for_update(
         ae_project_id: str,
@@ -187,6 +220,7 @@ def create_update_tab(
         select_element.clear()
         select_element.set_value(None)
         page_state["update_agents"] = []
+        page_state["update_agents_by_name"] = {}
         select_element.set_visibility(False)
 
         existing_agents, error_msg = await _fetch_vertex_ai_resources(
@@ -205,57 +239,56 @@ def create_update_tab(
 
         if existing_agents is not None:
             page_state["update_agents"] = existing_agents
+            page_state["update_agents_by_name"] = {
+                agent.resource_name: agent for agent in existing_agents
+            }
 
             if not existing_agents:
                 ui.notify("No deployed Agent Engines found.", type="info")
                 select_element.set_options([])
+                page_state["update_options_hash"] = None
             else:
-                options = await asyncio.to_thread(
-                    _create_update_options, existing_agents
+                # Any redeploy or edit bumps update_time, so an unchanged
+                # signature means the formatted options can be reused as-is.
+                options_key = frozenset(
+                    (agent.resource_name, agent.update_time)
+                    for agent in existing_agents
                 )
-                select_element.set_options(options)
+                options_cache = page_state.setdefault("update_options_cache", {})
+                cached = options_cache.get(options_key)
+                if cached is None:
+                    cached = await asyncio.to_thread(
+                        _create_update_options, existing_agents
+                    )
+                    options_cache.clear()
+                    options_cache[options_key] = cached
+                options, page_state["update_agent_meta"] = cached
+                # set_options pushes the full option list to the browser, so
+                # skip it when the client already shows the same options.
+                options_hash = hash(tuple(sorted(options.items())))
+                if options_hash != page_state.get("update_options_hash"):
+                    select_element.set_options(options)
+                    page_state["update_options_hash"] = options_hash
 
             select_element.set_visibility(True)
             fetch_button.enable()
         fetch_button.enable()
 
     def update_details_view(selection):
-        selected_agent = next((
-            agent
-            for agent in page_state["update_agents"]
-            if agent.resource_name == selection.value
-        ),
-        None,
-    )
+        selected_agent = page_state.get("update_agents_by_name", {}).get(
+            selection.value
+        )
         if selected_agent:
             page_state["update_selected_agent"] = selected_agent
-            create_time_str = (
-                selected_agent.create_time.strftime("%Y-%m-%d %H:%M")
-                if selected_agent.create_time
-                else "N/A"
-            )
-            update_time_str = (
-                selected_agent.update_time.strftime("%Y-%m-%d %H:%M")
-                if selected_agent.update_time
-                else "N/A"
+            agent_meta = page_state["update_agent_meta"][selection.value]
+            selected_agent_label.text = (
+                f"Selected Agent: {update_ae_select.options[selection.value]}"
             )
-            selected_agent_label.text = f"Selected Agent: {selected_agent.display_name} ({selected_agent.resource_name.split('/')[-1]}) | Created: {create_time_str} | Updated: {update_time_str}"
             current_display_name_label.text = selected_agent.display_name
             update_display_name_input.value = selected_agent.display_name
-            description_str = ""
-            if (
-                hasattr(selected_agent, "_gca_resource")
-                and hasattr(selected_agent._gca_resource, "description")
-                and selected_agent._gca_resource.description
-            ):
-                description_str = selected_agent._gca_resource.description
-            current_description_label.text = description_str
-            update_description_input.value = description_str
-            agent_dict = selected_agent.to_dict()
-            service_account = agent_dict.get("spec", {}).get(
-                "serviceAccount", "N/A (Default AE Service Acct)"
-            )
-            update_service_account_input.value = service_account
+            current_description_label.text = agent_meta["description"]
+            update_description_input.value = agent_meta["description"]
+            update_service_account_input.value = agent_meta["service_account"]
             stepper_update.next()
 
     update_ae_select.on("change", update_details_view)
@@ -266,13 +299,19 @@ async def run_actual_update(
     location: str,
     bucket: str,
     agent: Any,
-    agent_config: dict,
+    agent_config: Mapping[str, Any],
     new_display_name: str,
     new_description: str,
     new_service_account: str,
     status_area: ui.column,
+    result_label: ui.label,
+    result_markdown: ui.markdown,
+    result_html: ui.html,
 ) -> None:
     status_area.clear()
+    for element in (result_label, result_markdown, result_html):
+        element.set_visibility(False)
+    result_label.classes(remove="text-red-600")
 
     timer_label = None
     stop_timer_event = asyncio.Event()
@@ -327,14 +366,13 @@ async def run_actual_update(
 
     adk_app = AdkApp(agent=root_agent, enable_tracing=True)
     agent_specific_reqs = agent_config.get("requirements", [])
-    if not isinstance(agent_specific_reqs, list):
+    if not isinstance(agent_specific_reqs, (list, tuple)):
         agent_specific_reqs = []
-    combined_requirements = sorted(
-        list(set(_BASE_REQUIREMENTS) | set(agent_specific_reqs))
-    )
+    combined_requirements = sorted(_BASE_REQ_SET.union(agent_specific_reqs))
     extra_packages = agent_config.get("extra_packages", [])
-    if not isinstance(extra_packages, list):
+    if not isinstance(extra_packages, (list, tuple)):
         extra_packages = []
+    extra_packages = list(extra_packages)
 
     with status_area:
         progress_label.set_text(
@@ -347,6 +385,7 @@ async def run_actual_update(
     )
     remote_agent = None
     update_error = None
+    tb_str = ""
     try:
 
         def sync_update_agent():
@@ -363,17 +402,19 @@ async def run_actual_update(
 
             return agent_engines.update(agent.resource_name, **update_kwargs)
 
-        remote_agent = await asyncio.to_thread(sync_update_agent)
+        remote_agent = await asyncio.get_running_loop().run_in_executor(
+            _UPDATE_POOL, sync_update_agent
+        )
     except Exception as e:
         update_error = e
         tb_str = traceback.format_exc()
         logger.error(f"--- Agent update failed for {agent.display_name} ---\n{tb_str}")
     finally:
         stop_timer_event.set()
-        await asyncio.sleep(0.1)
         end_time = time.monotonic()
         duration = end_time - start_time
-        duration_str = time.strftime("%M:%S", time.gmtime(duration))
+        minutes, seconds = divmod(int(duration), 60)
+        duration_str = f"{minutes:02d}:{seconds:02d}"
         spinner.set_visibility(False)
 
         with status_area:
@@ -388,8 +429,10 @@ async def run_actual_update(
                 progress_label.set_text(
                     f"Update Successful! (Duration: {duration_str})"
                 )
-                ui.label("Resource Name:").classes("font-semibold mt-2")
-                ui.markdown(f"`{remote_agent.resource_name}`").classes("text-sm")
+                result_label.set_text("Resource Name:")
+                result_label.set_visibility(True)
+                result_markdown.set_content(f"`{remote_agent.resource_name}`")
+                result_markdown.set_visibility(True)
                 ui.notify(
                     success_msg,
                     type="positive",
@@ -399,16 +442,17 @@ async def run_actual_update(
         else:
             error_msg = f"Error during agent engine update: {update_error}"
             logger.error(
-                f"Update Failed for {agent.display_name}! (Duration: {duration_str}). Error: {update_error}\nTraceback: {traceback.format_exc()}"
+                f"Update Failed for {agent.display_name}! (Duration: {duration_str}). Error: {update_error}\nTraceback: {tb_str}"
             )
             with status_area:
                 progress_label.set_text(f"Update Failed! (Duration: {duration_str})")
-                ui.label("Error Details:").classes(
-                    "font-semibold mt-2 text-red-600"
-                )
-                ui.html(
-                    f"<pre class='text-xs p-2 bg-gray-100 dark:bg-gray-800 rounded overflow-auto'>{traceback.format_exc()}</pre>"
+                result_label.set_text("Error Details:")
+                result_label.classes(add="text-red-600")
+                result_label.set_visibility(True)
+                result_html.set_content(
+                    f"<pre class='text-xs p-2 bg-gray-100 dark:bg-gray-800 rounded overflow-auto'>{tb_str}</pre>"
                 )
+                result_html.set_visibility(True)
                 ui.notify(
                     error_msg,
                     type="negative",
@@ -0,0 +1,44 @@
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""Helpers that defer google.adk imports and agent construction.
+
+Gallery modules build their root_agent through these so that importing the
+module stays cheap; ADK is only imported when root_agent is first accessed.
+"""
+
+import functools
+from typing import Any, Callable
+
+
+def make_agent(**kwargs: Any) -> Any:
+    """Constructs a google.adk Agent, importing ADK on first use."""
+    from google.adk.agents import Agent
+
+    return Agent(**kwargs)
+
+
+def lazy_root_agent(module_name: str, build: Callable[[], Any]) -> Callable[[str], Any]:
+    """Returns a module __getattr__ (PEP 562) that serves root_agent.
+
+    build() runs on the first access of root_agent and its result is reused
+    afterwards, so getattr(module, "root_agent") keeps working for ADK's loader
+    and the lifecycle manager.
+    """
+    build_once = functools.cache(build)
+
+    def __getattr__(name: str) -> Any:
+        if name == "root_agent":
+            return build_once()
+        raise AttributeError(f"module {module_name!r} has no attribute {name!r}")
+
+    return __getattr__
@@ -12,40 +12,70 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from google.adk import Agent
-from google.adk.tools import load_artifacts
-from google.adk.tools.tool_context import ToolContext
-from google.genai import Client, types
+import functools
+from typing import TYPE_CHECKING
+
+from agents_gallery._lazy import lazy_root_agent, make_agent
+
+if TYPE_CHECKING:
+  from google.adk.tools.tool_context import ToolContext
+
+
+_IMAGE_MODEL = 'imagen-4.0-fast-generate-001'
+_IMAGE_CONFIG = {'number_of_images': 1}
+
+
+@functools.cache
+def _generate_images():
+  """Returns generate_images bound to the fixed model and config."""
+  from google.genai import Client
+
+  return functools.partial(
+      Client().aio.models.generate_images,
+      model=_IMAGE_MODEL,
+      config=_IMAGE_CONFIG,
+  )
+
+
+# Result templates for generate_image. ADK wraps any non-dict tool result, so a
+# fresh dict is returned each call rather than a shared read-only mapping.
+_FAILED_RESULT = {'status': 'failed'}
+_SUCCESS_RESULT = {
+    'status': 'success',
+    'detail': 'Image generated successfully and stored in artifacts.',
+}
 
-client = Client()
 
 async def generate_image(prompt: str, generated_image_name: str, tool_context: 'ToolContext'):
   """Generates an image based on the prompt."""
-  response = client.models.generate_images(
-      model='imagen-4.0-fast-generate-001',
-      prompt=prompt,
-      config={'number_of_images': 1},
-  )
+  from google.genai import types
+
+  response = await _generate_images()(prompt=prompt)
   if not response.generated_images:
-    return {'status': 'failed'}
-  image_bytes = response.generated_images[0].image.image_bytes
-  await tool_context.save_artifact(
-      generated_image_name,
-      types.Part.from_bytes(data=image_bytes, mime_type='image/png'),
+    return dict(_FAILED_RESULT)
+  # Part.from_bytes keeps a reference to the bytes rather than copying them,
+  # so the response can be released before the artifact upload.
+  image_part = types.Part.from_bytes(
+      data=response.generated_images[0].image.image_bytes,
+      mime_type='image/png',
   )
-  return {
-      'status': 'success',
-      'detail': 'Image generated successfully and stored in artifacts.',
-      'filename': generated_image_name,
-  }
-
-
-root_agent = Agent(
-    model='gemini-2.5-flash',
-    name='root_agent',
-    description="""An agent that generates images and answer questions about the images.""",
-    instruction="""You are an agent whose job is to generate or edit an image based on the user's prompt.
+  del response
+  await tool_context.save_artifact(generated_image_name, image_part)
+  return {**_SUCCESS_RESULT, 'filename': generated_image_name}
+
+
+def _build_root_agent():
+  from google.adk.tools import load_artifacts
+
+  return make_agent(
+      model='gemini-2.5-flash',
+      name='root_agent',
+      description="""An agent that generates images and answer questions about the images.""",
+      instruction="""You are an agent whose job is to generate or edit an image based on the user's prompt.
     When generating an image come up with a unique file name (e.g. filename.png) that the generate_image tool will use based on the users prompt.
     """,
-    tools=[generate_image, load_artifacts],
-)
+      tools=[generate_image, load_artifacts],
+  )
+
+
+__getattr__ = lazy_root_agent(__name__, _build_root_agent)
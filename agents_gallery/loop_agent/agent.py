@@ -11,66 +11,61 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
-from google.adk.agents.callback_context import CallbackContext
-from google.adk.agents.llm_agent import Agent
-from google.adk.agents.loop_agent import LoopAgent
-from google.adk.tools import ToolContext
+from typing import TYPE_CHECKING
 
-context = {
-    "current_round_number": 1,
-}
+from pydantic import BaseModel, Field
 
+from agents_gallery._lazy import lazy_root_agent, make_agent
 
-def debate_status(callback_context: CallbackContext):
+if TYPE_CHECKING:
+    from google.adk.agents.callback_context import CallbackContext
+    from google.adk.tools import ToolContext
+
+def debate_status(callback_context: "CallbackContext"):
     current_round = callback_context.state.get("current_round_number", 0)
     print(f"END ROUND: {current_round}")
     callback_context.state["current_round_number"] = current_round + 1
 
 
-def stop(reason: str, tool_context: ToolContext):
+def stop(reason: str, tool_context: "ToolContext"):
     """Indicate that the debate is over."""
     tool_context.actions.escalate = True
 
     return reason
 
 
-affirmative_agent = Agent(
-    name="affirmative_agent",
-    model="gemini-2.5-flash",
-    instruction="""
-      You are the first speaker from the affirmative team in a debate.
-      You are supportive to the topic.
-      You will be given a topic to debate.
-      Your job is to make a speech supporting the affirmative position.
-      Your speech must be concise, less than 50 words.
-      In addition to your statement, you can also ask a question to the
-      other team.
-      If there's a question to you, you will answer it.
-      Prefix your speech with [affirmative_agent].
-""",
-)
-
-opposition_agent = Agent(
-    name="opposition_agent",
-    model="gemini-2.5-flash",
-    instruction="""
-      You are the first speaker from the opposition team in a debate.
-      You are against to the topic.
+class DebateSpeeches(BaseModel):
+    """One round of speeches, kept as separate fields for the judge."""
+
+    affirmative: str = Field(description="The affirmative team's speech.")
+    opposition: str = Field(description="The opposition team's speech.")
+
+
+DEBATERS_INSTRUCTION = """
+      You voice both first speakers in a debate, one after the other.
       You will be given a topic to debate.
-      Your job is to make a speech supporting the opposition position.
-      Your speech must be concise, less than 50 words.
-      In addition to your statement, you can also ask a question to the
-      other team.
-      If there's a question to you, you will answer it.
-      Prefix your speech with [opposition_agent].
-""",
-)
-
-judge_agent = Agent(
-    name="judge_agent",
-    model="gemini-2.5-flash",
-    instruction="""
+
+      First, as the affirmative team, you are supportive to the topic and
+      make a speech supporting the affirmative position.
+      Then, as the opposition team, you are against the topic and make a
+      speech supporting the opposition position, responding to what the
+      affirmative speaker just said.
+
+      Each speech must be concise, less than 50 words.
+      In addition to its statement, each speaker can also ask a question to
+      the other team.
+      If there's a question to a speaker, that speaker will answer it.
+
+      Reply with a JSON object with exactly two fields:
+      "affirmative": the affirmative team's speech.
+      "opposition": the opposition team's speech.
+"""
+
+JUDGE_INSTRUCTION = """
     You serve as the judge of a debate.
+    The speeches of the latest round are:
+    {debate_speeches}
+    Judge the "affirmative" and "opposition" speeches separately.
     Your job is to moderate the debate, ensuring that both sides have a fair
     chance to present their arguments.
 
@@ -84,22 +79,47 @@ judge_agent = Agent(
     1. State the winner and the reason with '[winner] <winner>\n<reason>'.
     2. Then call exit_loop function.
 
-""",
-    tools=[stop],
-)
-
-loop_agent = LoopAgent(
-    name="debate_team",
-    sub_agents=[affirmative_agent, opposition_agent, judge_agent],
-)
+"""
 
-root_agent = Agent(
-    name="debate_host",
-    model="gemini-2.5-flash",
-    instruction=""""
+HOST_INSTRUCTION = """"
         You are a debate host, your job is to extract from the user a debate topic for which the debate_team will then argure and judge a winner.
         If the user asks you can provide a few options that may be relevant.
         If a user decided to go with one of your suggestions, you must get confirmation before transfering to the debate_team."
-        """,
-    sub_agents=[loop_agent],
-)
+        """
+
+
+def _build_root_agent():
+    from google.adk.agents.loop_agent import LoopAgent
+
+    # Both debaters speak in a single model call per round: the shared debate
+    # context is sent once instead of once per speaker, and a round costs two
+    # LLM round-trips (debaters, judge) instead of three.
+    debaters_agent = make_agent(
+        name="debaters_agent",
+        model="gemini-2.5-flash",
+        instruction=DEBATERS_INSTRUCTION,
+        output_schema=DebateSpeeches,
+        output_key="debate_speeches",
+    )
+
+    judge_agent = make_agent(
+        name="judge_agent",
+        model="gemini-2.5-flash",
+        instruction=JUDGE_INSTRUCTION,
+        tools=[stop],
+    )
+
+    loop_agent = LoopAgent(
+        name="debate_team",
+        sub_agents=[debaters_agent, judge_agent],
+    )
+
+    return make_agent(
+        name="debate_host",
+        model="gemini-2.5-flash",
+        instruction=HOST_INSTRUCTION,
+        sub_agents=[loop_agent],
+    )
+
+
+__getattr__ = lazy_root_agent(__name__, _build_root_agent)
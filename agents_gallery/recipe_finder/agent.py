@@ -11,37 +11,50 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import functools
 import logging
 import os
 
 from dotenv import load_dotenv
-from google.adk.agents import Agent
-from google.adk.tools import VertexAiSearchTool
-
-# Initialize logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-)
+
+from agents_gallery._lazy import lazy_root_agent, make_agent
+
 logger = logging.getLogger(__name__)
 
 
-# Load environment specific entries from env file
-load_dotenv()
-RECIPE_DATASTORE: str = os.environ.get("RECIPE_DATASTORE")
-MODEL_NAME: str = os.environ.get("MODEL_NAME")
 INSTRUCTIONS ="""You are a helpful assistant specializing in looking up cooking recipes from a Vertex AI Search Datastore.
         Use the search tool to find relevant information before answering.
         If the answer isn't in the documents, say that you couldn't find the information."""
 
-# # Initialize the Vertex AI Search tool
-recipe_search_tool = VertexAiSearchTool(data_store_id=RECIPE_DATASTORE)
-    
-# Define Root Agent
-root_agent = Agent(
-    name="RootAgent",
-    model=MODEL_NAME,
-    description="Root Agent",
-    instruction=INSTRUCTIONS,
-    tools=[recipe_search_tool],
-)
+
+# The .env lookup, the google.adk import and tool/agent construction are
+# deferred until root_agent is first accessed, so importing this module (e.g.
+# when the lifecycle manager discovers gallery agents) stays cheap. Logging
+# configuration is left to the application that loads the agent.
+@functools.cache
+def _ensure_initialized() -> None:
+    # Load environment specific entries from env file
+    load_dotenv()
+
+
+@functools.cache
+def _recipe_search_tool():
+    from google.adk.tools import VertexAiSearchTool
+
+    _ensure_initialized()
+    return VertexAiSearchTool(data_store_id=os.environ.get("RECIPE_DATASTORE"))
+
+
+def _build_root_agent():
+    recipe_search_tool = _recipe_search_tool()
+    return make_agent(
+        name="RootAgent",
+        model=os.environ.get("MODEL_NAME"),
+        description="Root Agent",
+        instruction=INSTRUCTIONS,
+        tools=[recipe_search_tool],
+    )
+
+
+# Define Root Agent on first access (PEP 562).
+__getattr__ = lazy_root_agent(__name__, _build_root_agent)
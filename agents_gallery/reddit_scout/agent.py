@@ -1,8 +1,13 @@
+import functools
 import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 
 import praw
 from dotenv import load_dotenv
 from google.adk.agents import Agent
+from google.api_core import exceptions as google_exceptions
 from google.cloud import secretmanager
 from praw.exceptions import PRAWException
 
@@ -11,15 +16,74 @@ from .utils import constants
 
 load_dotenv(override=True)
 
+SECRET_CACHE_TTL_SECONDS = 600
+SECRET_FAILURE_CACHE_TTL_SECONDS = 60
+REDDIT_BASE_URL = "https://www.reddit.com"
+
+# constants.py has used both names for the client secret key; pick whichever
+# is defined once, rather than on every call.
+_CLIENT_SECRET_KEY = getattr(
+    constants,
+    "reddit_client_secret_secret_key",
+    getattr(constants, "reddit_client_secret_secret", None),
+)
+
+# Labels for the configuration values get_reddit_news needs, in the order the
+# values are checked.
+_REQUIRED_CONFIG_LABELS = (
+    "Secret Manager Project ID",
+    "Reddit Client ID Secret Key",
+    "Reddit Client Secret Secret Key",
+    "Reddit User Agent",
+)
+
+# (project_id, secret_id, version_id) -> (fetched_at, value).
+_SECRET_CACHE: dict[tuple[str, str, str], tuple[float, str]] = {}
+# (project_id, secret_id, version_id) -> failed_at, for errors that won't go
+# away on retry (missing secret, no access). Other failures are retried.
+_SECRET_FAILURE_CACHE: dict[tuple[str, str, str], float] = {}
+
+# One read-only PRAW client is reused across calls so its HTTP session and
+# OAuth token survive between tool invocations. It is rebuilt only when the
+# credentials it was built with change.
+_REDDIT: praw.Reddit | None = None
+_REDDIT_KEY: tuple[str, str, str] | None = None
+_REDDIT_LOCK = threading.Lock()
+
+
+@functools.cache
+def _get_secret_client() -> secretmanager.SecretManagerServiceClient:
+    # The GAPIC client is thread-safe; share one channel across lookups.
+    return secretmanager.SecretManagerServiceClient()
+
+
 def get_secret(
     project_id: str, secret_id: str, version_id: str = "latest"
 ) -> str | None:
     """Retrieves a secret value from Google Cloud Secret Manager."""
+    cache_key = (project_id, secret_id, version_id)
+    cached = _SECRET_CACHE.get(cache_key)
+    if cached and time.monotonic() - cached[0] < SECRET_CACHE_TTL_SECONDS:
+        return cached[1]
+    failed_at = _SECRET_FAILURE_CACHE.get(cache_key)
+    if failed_at and time.monotonic() - failed_at < SECRET_FAILURE_CACHE_TTL_SECONDS:
+        return None
     try:
-        client = secretmanager.SecretManagerServiceClient()
+        client = _get_secret_client()
         name = f"projects/{project_id}/secrets/{secret_id}/versions/{version_id}"
         response = client.access_secret_version(request={"name": name})
-        return response.payload.data.decode("UTF-8")
+        # Reddit OAuth credentials are plain ASCII, for which latin-1 decodes
+        # identically to UTF-8 without validating multi-byte sequences.
+        value = response.payload.data.decode("latin-1")
+        _SECRET_CACHE[cache_key] = (time.monotonic(), value)
+        return value
+    except (google_exceptions.NotFound, google_exceptions.PermissionDenied) as e:
+        _SECRET_FAILURE_CACHE[cache_key] = time.monotonic()
+        print(
+            f"--- Tool error: Failed to access secret {secret_id} in project"
+            f" {project_id}. Error: {e} ---"
+        )
+        return None
     except Exception as e:
         print(
             f"--- Tool error: Failed to access secret {secret_id} in project"
@@ -28,25 +92,64 @@ def get_secret(
         return None
 
 
+def get_secrets(project_id: str, secret_ids: list[str]) -> list[str | None]:
+    """Retrieves several secrets concurrently, in the order of secret_ids.
+
+    Secret Manager has no batch access RPC, so the lookups are issued in
+    parallel over the shared client instead of one after another.
+    """
+    with ThreadPoolExecutor(max_workers=len(secret_ids) or 1) as executor:
+        return list(
+            executor.map(functools.partial(get_secret, project_id), secret_ids)
+        )
+
+
+def _get_reddit(client_id: str, client_secret: str, user_agent: str) -> praw.Reddit:
+    """Returns the shared read-only PRAW client for these credentials."""
+    global _REDDIT, _REDDIT_KEY
+    key = (client_id, client_secret, user_agent)
+    with _REDDIT_LOCK:
+        if _REDDIT is None or _REDDIT_KEY != key:
+            _REDDIT = praw.Reddit(
+                client_id=client_id,
+                client_secret=client_secret,
+                user_agent=user_agent,
+                # Adding read_only=True is good practice if you only fetch data
+                read_only=True,
+            )
+            _REDDIT_KEY = key
+        return _REDDIT
+
+
 def get_reddit_news(
-    subreddit: str,
+    subreddits: list[str] | str,
     limit: int = 5,
 ) -> dict[str, list[dict[str, str | int]] | list[str]]:
     """
-    Fetches top post titles and links from a specified subreddit using the Reddit API.
+    Fetches top post titles and links from one or more subreddits using the Reddit API.
+
+    Several subreddits are fetched with a single request to Reddit's combined
+    r/sub1+sub2 listing, so asking for N subreddits costs one API call.
 
     Args:
-        subreddit: The name of the subreddit to fetch news from (e.g., 'louisville').
-        limit: The maximum number of top posts to fetch (default: 5).
+        subreddits: The subreddit name, or a list of names, to fetch news from
+            (e.g., 'louisville' or ['nyc', 'chicago']).
+        limit: The maximum number of top posts to fetch per subreddit (default: 5).
 
     Returns:
-        On success: A dictionary with the subreddit name as key and a list of
+        On success: A dictionary with each subreddit name as key and a list of
         dictionaries as value. Each inner dictionary contains 'title' and 'link'
         keys for a post.
-        On error: A dictionary with the subreddit name as key and a list containing
+        On error: A dictionary with each subreddit name as key and a list containing
         a single error message string as value (e.g., if credentials are missing,
         the subreddit is invalid, or an API error occurs).
     """
+    subreddit_list = [subreddits] if isinstance(subreddits, str) else list(subreddits)
+    # Reddit's display names carry no "r/" prefix; match case-insensitively.
+    query_names = [
+        name.strip().removeprefix("/").removeprefix("r/") for name in subreddit_list
+    ]
+    subreddit = "+".join(query_names)
     print(
         f"--- Tool called: Fetching from r/{subreddit} via Reddit API (using Secret Manager) ---"
     )
@@ -55,89 +158,94 @@ def get_reddit_news(
     secretmanager_project_id = constants.sm_project_id
     # Use constants imported from utils.constants
     client_id_key = constants.reddit_client_id_secret_key
-    # Corrected variable name from constants.py if needed, assuming it's reddit_client_secret_secret_key
-    client_secret_key = getattr(constants, 'reddit_client_secret_secret_key', constants.reddit_client_secret_secret)
+    client_secret_key = _CLIENT_SECRET_KEY
     user_agent = constants.reddit_user_agent
 
     # Validate necessary configuration
-    if not all([secretmanager_project_id, client_id_key, client_secret_key, user_agent]):
-        missing_vars = [
-            var
-            for var, val in {
-                "Secret Manager Project ID": secretmanager_project_id,
-                "Reddit Client ID Secret Key": client_id_key,
-                "Reddit Client Secret Secret Key": client_secret_key,
-                "Reddit User Agent": user_agent,
-            }.items()
-            if not val
-        ]
+    missing_vars = [
+        label
+        for label, val in zip(
+            _REQUIRED_CONFIG_LABELS,
+            (secretmanager_project_id, client_id_key, client_secret_key, user_agent),
+        )
+        if not val
+    ]
+    if missing_vars:
         print(
             f"--- Tool error: Missing configuration values in constants.py: {', '.join(missing_vars)} ---"
         )
         return {
-            subreddit: [
+            name: [
                 f"Error: Missing configuration in constants.py ({', '.join(missing_vars)}). Please check agents_gallery/reddit_scout/utils/constants.py."
             ]
+            for name in subreddit_list
         }
 
     # Retrieve secrets from Secret Manager
-    client_id = get_secret(secretmanager_project_id, client_id_key)
-    client_secret = get_secret(secretmanager_project_id, client_secret_key)
+    client_id, client_secret = get_secrets(
+        secretmanager_project_id, [client_id_key, client_secret_key]
+    )
 
     if not client_id or not client_secret:
         return {
-            subreddit: [
+            name: [
                 "Error: Failed to retrieve Reddit API credentials from Secret Manager."
             ]
+            for name in subreddit_list
         }
 
     try:
-        reddit = praw.Reddit(
-            client_id=client_id,
-            client_secret=client_secret,
-            user_agent=user_agent,
-            # Adding read_only=True is good practice if you only fetch data
-            read_only=True,
-        )
+        reddit = _get_reddit(client_id, client_secret, user_agent)
 
         sub = reddit.subreddit(subreddit)
-        # Accessing sub.hot will raise appropriate exceptions if invalid/private/banned
-        top_posts = list(sub.hot(limit=limit))  # Fetch hot posts
+        # Accessing sub.hot will raise appropriate exceptions if invalid/private/banned.
+        # The listing is paginated lazily, so it is consumed as it streams in.
+        top_posts = sub.hot(limit=limit * len(query_names))  # Fetch hot posts
+
+        # Bucket the combined listing back into per-subreddit lists, each capped
+        # at limit, keyed by the names the caller passed in.
+        posts_by_name = {name.lower(): [] for name in query_names}
 
         # Create a list of dictionaries, each containing title, permalink, upvotes and comments.
         # Additional details on the submission attributes can be found here: https://praw.readthedocs.io/en/stable/code_overview/models/submission.html
 
-        posts_data = [
-            {
-                "title": post.title,
-                "link": f"https://www.reddit.com{post.permalink}",
-                "upvotes": post.score,
-                "comments": post.num_comments,
-            }
-            
-            for post in top_posts
-        ]
-
-        if not posts_data:
-            return {subreddit: [f"No recent hot posts found in r/{subreddit}."]}
+        for post in top_posts:
+            bucket = posts_by_name.get(post.subreddit.display_name.lower())
+            if bucket is not None and len(bucket) < limit:
+                bucket.append(
+                    {
+                        "title": post.title,
+                        "link": f"{REDDIT_BASE_URL}{post.permalink}",
+                        "upvotes": post.score,
+                        "comments": post.num_comments,
+                    }
+                )
 
-        return {subreddit: posts_data}
+        results = {}
+        for name, query_name in zip(subreddit_list, query_names):
+            posts_data = posts_by_name[query_name.lower()]
+            results[name] = posts_data or [
+                f"No recent hot posts found in r/{query_name}."
+            ]
+        return results
 
     except PRAWException as e:
         # Handle specific PRAW exceptions if needed (e.g., Redirect for non-existent sub)
         print(f"--- Tool error: Reddit API error for r/{subreddit}: {e} ---")
         return {
-            subreddit: [
+            name: [
                 f"Error accessing r/{subreddit}. It might be private, banned, or non-existent, or there might be an authentication issue. Details: {e}"
             ]
+            for name in subreddit_list
         }
     except Exception as e:  # Catch other potential errors
         print(f"--- Tool error: Unexpected error for r/{subreddit}: {e} ---")
         # Return error in the simpler format
         return {
-            subreddit: [
+            name: [
                 f"An unexpected error occurred while fetching from r/{subreddit}."
             ]
+            for name in subreddit_list
         }
 
 
@@ -150,8 +258,8 @@ root_agent = Agent(
         "You are the Reddit News Scout. Your primary task is to fetch and present/top news from Reddit."
         "1. **Identify Intent:** Determine if the user is asking for news or related topics."
         "2. **Determine Subreddit:** Identify which subreddit(s) to check. Use '/r/news' by default if none are specified. Use the specific subreddit(s) if mentioned (e.g., '/r/nyc', '/r/chicago')."
-        "3. **Call Tool:** You **MUST** call the `get_reddit_news` tool with the identified subreddit(s). Do NOT generate summaries or links without calling the tool first."
-        "4. **Process Tool Output:** The tool will return a dictionary. The key is the subreddit name. The value is either a list of dictionaries (each with 'title', 'link', 'upvotes', and 'comments' keys) on success, or a list containing a single error message string on failure."
+        "3. **Call Tool:** You **MUST** call the `get_reddit_news` tool with the identified subreddit(s). When several subreddits are requested, pass them all as a list in a single call. Do NOT generate summaries or links without calling the tool first."
+        "4. **Process Tool Output:** The tool will return a dictionary. Each key is a subreddit name. Each value is either a list of dictionaries (each with 'title', 'link', 'upvotes', and 'comments' keys) on success, or a list containing a single error message string on failure."
         "5. **Format Response:**"
         "   - If the tool returned an error message (a list with one string), report that exact message directly."
         "   - If the tool returned successfully (a list of dictionaries):"
@@ -11,17 +11,62 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import functools
+import time
+
 import yfinance as yf
 from google.adk.agents import Agent
 
+# Quotes are already delayed, so re-serving one for up to a minute is fine.
+QUOTE_CACHE_SECONDS = 60
+
+
+@functools.lru_cache(maxsize=256)
+def _get_quote(symbol: str, time_bucket: int) -> dict:
+    # time_bucket only partitions the cache; a new bucket forces a fresh fetch.
+    fast_info = yf.Ticker(symbol).fast_info
+    return {
+        "symbol": symbol,
+        "price": fast_info["last_price"],
+        "currency": fast_info["currency"],
+    }
+
 
 def get_stock_price(symbol: str) -> dict:
     """Returns the current (delayed) stock price given the symbol.
     Args:
       symbol: GOOG, AAPL, MSFT, etc.
     """
-    dat = yf.Ticker(symbol)
-    return dat.info
+    # fast_info reads a single quote/chart endpoint instead of scraping the
+    # full profile that Ticker.info assembles from several requests.
+    quote = _get_quote(symbol.upper(), int(time.time() // QUOTE_CACHE_SECONDS))
+    return dict(quote)
+
+
+def get_stock_prices(symbols: list[str]) -> dict:
+    """Returns the latest (delayed) price for several stock symbols at once.
+    Args:
+      symbols: A list of symbols, e.g. ["GOOG", "AAPL", "MSFT"].
+    """
+    symbols = [symbol.upper() for symbol in symbols]
+    if not symbols:
+        return {}
+    # One batched download fetches every symbol concurrently. A 5 day window of
+    # daily bars still has a last close over weekends and market holidays.
+    data = yf.download(
+        symbols,
+        period="5d",
+        interval="1d",
+        group_by="ticker",
+        threads=True,
+        progress=False,
+    )
+    downloaded = set(data.columns.get_level_values(0))
+    prices = {}
+    for symbol in symbols:
+        closes = data[symbol]["Close"].dropna() if symbol in downloaded else ()
+        prices[symbol] = float(closes.iloc[-1]) if len(closes) else None
+    return prices
 
 
 # Must be named root_agent (for root agent, sub-agents can be different).
@@ -35,6 +80,7 @@ root_agent = Agent(
         User must provide a stock ticker, not the company name.
         
         You have access to tools: `get_stock_price`: Use this tool to get the current (delayed) stock price.
+        `get_stock_prices`: Use this tool instead when the user asks about several tickers at once.
     """,
-    tools=[get_stock_price],
+    tools=[get_stock_price, get_stock_prices],
 )
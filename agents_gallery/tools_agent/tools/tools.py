@@ -11,10 +11,13 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import functools
 import logging
 import os
-import uuid
+import random
+import time
 
+from google.api_core import exceptions as google_exceptions
 from google.cloud import secretmanager
 
 logging.basicConfig(
@@ -23,6 +26,18 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+SECRET_FAILURE_CACHE_TTL_SECONDS = 60
+
+# (project_id, secret_id, version_id) -> (failed_at, error_message), for errors
+# that won't go away on retry (missing secret, no access).
+_SECRET_FAILURE_CACHE: dict[tuple[str, str, str], tuple[float, str]] = {}
+
+
+@functools.cache
+def _get_secret_client() -> secretmanager.SecretManagerServiceClient:
+    # The GAPIC client is thread-safe; reuse its gRPC channel across calls.
+    return secretmanager.SecretManagerServiceClient()
+
 
 def flip_a_coin() -> str:
     """Simulates flipping a coin, returning either "Heads" or "Tails".
@@ -35,7 +50,7 @@ def flip_a_coin() -> str:
     logger.info("Flipping a coin...")
 
     # simulate flipping a coin with equal probability of heads or tails
-    result = "Heads" if uuid.uuid4().int % 2 == 0 else "Tails"
+    result = "Heads" if random.getrandbits(1) else "Tails"
     return result
 
 
@@ -50,9 +65,13 @@ def roll_die(die_sides: int) -> str:
     logger.info("rolling a die...")
 
     # simulate rolling a die based on the number of sides
-    result = str(uuid.uuid4().int % die_sides)
+    result = str(random.randrange(die_sides) + 1)
     return result
 
+
+_SPECIFIED_ENV_VARS = ("VARIABLE1", "VARIABLE2")
+
+
 def list_environment_variables() -> dict[str, str]:
     """Lists specified environment variables: 'variable1' and 'variable2'.
 
@@ -62,14 +81,11 @@ def list_environment_variables() -> dict[str, str]:
         it will not be included in the dictionary.
     """
     logger.info("Listing specific environment variables: variable1, variable2...")
-    specified_vars = ["VARIABLE1"
-                      ,"VARIABLE2"]
-    env_vars = {}
-    for var_name in specified_vars:
-        var_value = os.environ.get(var_name)
-        if var_value is not None:
-            env_vars[var_name] = var_value
-    return env_vars
+    return {
+        var_name: var_value
+        for var_name in _SPECIFIED_ENV_VARS
+        if (var_value := os.environ.get(var_name)) is not None
+    }
 
 
 def get_secret_from_secret_manager(
@@ -90,18 +106,22 @@ def get_secret_from_secret_manager(
         error message if it fails.
         Example: 'secret id: my-secret\\nsecret value: my-secret-value'
     """
-    logger.info(
-        "Attempting to access secret '%s' (version: %s) in project '%s'...",
-        secret_id,
-        version_id,
-        project_id,
-    )
+    name = f"projects/{project_id}/secrets/{secret_id}/versions/{version_id}"
+    logger.info("Attempting to access secret '%s'...", name)
+    cache_key = (project_id, secret_id, version_id)
+    failure = _SECRET_FAILURE_CACHE.get(cache_key)
+    if failure and time.monotonic() - failure[0] < SECRET_FAILURE_CACHE_TTL_SECONDS:
+        return failure[1]
     try:
-        client = secretmanager.SecretManagerServiceClient()
-        name = f"projects/{project_id}/secrets/{secret_id}/versions/{version_id}"
+        client = _get_secret_client()
         response = client.access_secret_version(request={"name": name})
         secret_value = response.payload.data.decode("UTF-8")
         return f"secret id: {secret_id}\nsecret value: {secret_value}"
+    except (google_exceptions.NotFound, google_exceptions.PermissionDenied) as e:
+        error_message = f"Failed to access secret '{secret_id}' in project '{project_id}'. Error: {e}"
+        logger.error(error_message)
+        _SECRET_FAILURE_CACHE[cache_key] = (time.monotonic(), error_message)
+        return error_message
     except Exception as e:
         error_message = f"Failed to access secret '{secret_id}' in project '{project_id}'. Error: {e}"
         logger.error(error_message)
@@ -14,6 +14,20 @@
 from google.adk.agents import Agent
 
 
+_KM_PER_MILE = 1.60934
+_MM_PER_MILE = 1609340
+
+# (from_unit, to_unit) -> converter, keyed on lower-cased unit names.
+_CONVERSIONS = {
+    ("miles", "kilometers"): lambda v: v * _KM_PER_MILE,
+    ("kilometers", "miles"): lambda v: v / _KM_PER_MILE,
+    ("celsius", "fahrenheit"): lambda v: (v * 9 / 5) + 32,
+    ("fahrenheit", "celsius"): lambda v: (v - 32) * 5 / 9,
+    ("miles", "millimeters"): lambda v: v * _MM_PER_MILE,
+    ("millimeters", "miles"): lambda v: v / _MM_PER_MILE,
+}
+
+
 def convert_units(value: float, from_unit: str, to_unit: str) -> float:
     """Converts a value from one unit to another.
     Args:
@@ -23,20 +37,8 @@ def convert_units(value: float, from_unit: str, to_unit: str) -> float:
     Returns:
         The converted value, or None if the conversion is not supported.
     """
-    if from_unit.lower() == "miles" and to_unit.lower() == "kilometers":
-        return value * 1.60934
-    elif from_unit.lower() == "kilometers" and to_unit.lower() == "miles":
-        return value / 1.60934
-    elif from_unit.lower() == "celsius" and to_unit.lower() == "fahrenheit":
-        return (value * 9 / 5) + 32
-    elif from_unit.lower() == "fahrenheit" and to_unit.lower() == "celsius":
-        return (value - 32) * 5 / 9
-    elif from_unit.lower() == "miles" and to_unit.lower() == "millimeters":
-        return value * 1609340
-    elif from_unit.lower() == "millimeters" and to_unit.lower() == "miles":
-        return value / 1609340
-    else:
-        return None
+    converter = _CONVERSIONS.get((from_unit.lower(), to_unit.lower()))
+    return converter(value) if converter else None
 
 
 # Must be named root_agent
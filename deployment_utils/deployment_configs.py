@@ -1,3 +1,5 @@
+from types import MappingProxyType
+
 # Dictionary mapping agent names (used in --agent_name flag) to their specific configurations.
 AGENT_CONFIGS = {
     "tools_agent": {
@@ -126,3 +128,17 @@ AGENT_CONFIGS = {
     },
     
 }
+
+# Freeze the configs: the UI only reads them, and read-only mappings with tuple
+# values cannot be mutated by accident while one deployment is being prepared.
+AGENT_CONFIGS = MappingProxyType({
+    name: MappingProxyType({
+        **cfg,
+        **{
+            key: tuple(cfg[key])
+            for key in ("requirements", "extra_packages")
+            if key in cfg
+        },
+    })
+    for name, cfg in AGENT_CONFIGS.items()
+})
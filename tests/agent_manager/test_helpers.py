@@ -0,0 +1,101 @@
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+# Unit testing for the Vertex AI resource listing helpers
+
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+from google.api_core import exceptions as google_exceptions
+
+from agent_manager import helpers
+
+
+@pytest.fixture
+def mock_ui(monkeypatch):
+    mock_ui = MagicMock()
+    monkeypatch.setattr(helpers, "ui", mock_ui)
+    monkeypatch.setattr(helpers, "init_vertex_ai", lambda *args: (True, None))
+    return mock_ui
+
+
+def _collect_pages(resource_lister, page_size):
+    async def collect():
+        return [
+            page
+            async for page in helpers._iter_vertex_ai_resources_pages(
+                "project", "us-central1", resource_lister, {}, page_size=page_size
+            )
+        ]
+
+    return asyncio.run(collect())
+
+
+def test_iter_vertex_ai_resources_pages_splits_into_pages(mock_ui):
+    """
+    Test that resources are yielded in pages of at most page_size.
+    """
+    pages = _collect_pages(lambda: range(5), page_size=2)
+    assert pages == [[0, 1], [2, 3], [4]]
+
+
+def test_fetch_vertex_ai_resources_returns_all_resources(mock_ui):
+    """
+    Test that _fetch_vertex_ai_resources collects every resource and re-enables the button.
+    """
+    button = MagicMock()
+    resources, error_msg = asyncio.run(
+        helpers._fetch_vertex_ai_resources(
+            "project", "us-central1", lambda: range(120), {"button": button}
+        )
+    )
+    assert resources == list(range(120))
+    assert error_msg is None
+    button.enable.assert_called_once()
+
+
+def test_fetch_vertex_ai_resources_reports_permission_denied(mock_ui):
+    """
+    Test that a listing failure is notified, shown in the container and returned.
+    """
+
+    def denied():
+        raise google_exceptions.PermissionDenied("denied")
+
+    container = MagicMock()
+    resources, error_msg = asyncio.run(
+        helpers._fetch_vertex_ai_resources(
+            "project", "us-central1", denied, {"container": container}
+        )
+    )
+    assert resources is None
+    assert "Permission denied" in error_msg
+    mock_ui.notify.assert_called_once()
+    container.clear.assert_called_once()
+
+
+def test_close_de_async_client_closes_and_forgets_client():
+    """
+    Test that close_de_async_client closes the shared client and the next call builds a new one.
+    """
+
+    async def run():
+        client = helpers._de_async_client()
+        await helpers.close_de_async_client()
+        replacement = helpers._de_async_client()
+        await helpers.close_de_async_client()
+        return client, replacement
+
+    client, replacement = asyncio.run(run())
+    assert client.is_closed
+    assert replacement is not client
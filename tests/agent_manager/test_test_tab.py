@@ -0,0 +1,30 @@
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+# Smoke test for building the Test tab
+
+from unittest.mock import MagicMock
+
+from agent_manager import test_tab
+
+
+def test_create_test_tab_builds_with_mocked_ui(monkeypatch):
+    """
+    Test that create_test_tab builds and wires its handlers without a live UI.
+    """
+    mock_ui = MagicMock()
+    monkeypatch.setattr(test_tab, "ui", mock_ui)
+
+    test_tab.create_test_tab(test_tab.TestTabState(), MagicMock(), MagicMock())
+
+    send_button = mock_ui.button.return_value
+    assert send_button.on_click.called
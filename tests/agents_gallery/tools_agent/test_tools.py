@@ -31,19 +31,31 @@ def test_roll_die_returns_number_within_range():
     die_sides = 6
     result = roll_die(die_sides)
     assert result.isdigit()
-    assert 0 <= int(result) < die_sides
+    assert 1 <= int(result) <= die_sides
 
     die_sides = 10
     result = roll_die(die_sides)
     assert result.isdigit()
-    assert 0 <= int(result) < die_sides
+    assert 1 <= int(result) <= die_sides
 
     die_sides = 1
     result = roll_die(die_sides)
     assert result.isdigit()
-    assert 0 <= int(result) < die_sides
+    assert 1 <= int(result) <= die_sides
 
     die_sides = 2
     result = roll_die(die_sides)
     assert result.isdigit()
-    assert 0 <= int(result) < die_sides
+    assert 1 <= int(result) <= die_sides
+
+
+def test_roll_die_covers_both_bounds():
+    """
+    Test that roll_die can return 1 and die_sides but nothing outside them.
+    """
+    assert roll_die(1) == "1"
+
+    die_sides = 6
+    results = {int(roll_die(die_sides)) for _ in range(1000)}
+    assert min(results) == 1
+    assert max(results) == die_sides